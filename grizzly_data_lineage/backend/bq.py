@@ -12,11 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
 
 import google.auth.transport.requests
 from google.cloud import bigquery
 
+PREFETCH_TTL_SECONDS = 300
+PREFETCH_WORKERS = 4
+
+
+class TTLCache:
+  """Thread-safe dictionary whose entries expire after ttl seconds.
+
+  Entries are kept in expiration order, so expired ones are swept from the
+  front on every set and keys that are never read again do not pile up.
+  """
+
+  def __init__(self, ttl: float) -> None:
+    self._ttl = ttl
+    # ordered by expiration time, since every entry lives for the same ttl
+    self._entries = {}
+    self._lock = threading.Lock()
+
+  def get(self, key: Hashable) -> Optional[Any]:
+    """Returns the value stored under key or None if it has expired."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      expires_at, value = entry
+      if expires_at < time.monotonic():
+        del self._entries[key]
+        return None
+      return value
+
+  def set(self, key: Hashable, value: Any) -> None:
+    """Stores value under key and drops expired entries."""
+    with self._lock:
+      now = time.monotonic()
+      # re-insert the key so that it moves to the end of the order
+      self._entries.pop(key, None)
+      while self._entries:
+        oldest_key = next(iter(self._entries))
+        if self._entries[oldest_key][0] >= now:
+          break
+        del self._entries[oldest_key]
+      self._entries[key] = (now + self._ttl, value)
+
+
+# results of navigation queries that the dashboard is likely to request next
+_prefetch_cache = TTLCache(ttl=PREFETCH_TTL_SECONDS)
+_prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+# cache keys of prefetches that were submitted but did not finish yet
+_prefetch_in_flight = set()
+_prefetch_in_flight_lock = threading.Lock()
+
 
 class BackendBQClient:
   BUILD_DATETIMES_QUERY = """
@@ -27,20 +80,21 @@ class BackendBQClient:
   DL_BUILD_ID_QUERY = """
     SELECT data_lineage_build_id
     FROM `etl_log.vw_data_lineage_build` AS dlb
-    WHERE dlb.dt_build_datetime = DATETIME ('{datetime}')
+    WHERE dlb.dt_build_datetime = @datetime
+    LIMIT 1
     """
 
   DOMAINS_QUERY = """
     SELECT DISTINCT dlo.subject_area
     FROM `etl_log.vw_data_lineage_object` AS dlo
-    WHERE dlo.data_lineage_build_id = '{build_id}'
+    WHERE dlo.data_lineage_build_id = @build_id
     ORDER BY dlo.subject_area ASC
     """
   JOB_BUILD_IDS_QUERY = """
     SELECT DISTINCT target_table_name
     FROM `etl_log.vw_data_lineage_object` AS dlo
-    WHERE dlo.data_lineage_build_id = '{build_id}'
-    AND dlo.subject_area = '{domain}'
+    WHERE dlo.data_lineage_build_id = @build_id
+    AND dlo.subject_area = @domain
     ORDER BY dlo.target_table_name ASC
     """
 
@@ -53,23 +107,31 @@ class BackendBQClient:
       dlo.target_table_name, 
       dlo.object_data	
     FROM `etl_log.vw_data_lineage_object` AS dlo
-    WHERE dlo.data_lineage_build_id LIKE '{build_id}'
-    AND dlo.subject_area LIKE '{domain}'
-    AND dlo.target_table_name LIKE '{job_build_id}'
-    AND dlo.data_lineage_type = '{dl_type}'
+    WHERE {conditions}
     """
   DLC_QUERY = """
     SELECT 
-      dlc.subject_area, 
       dlc.source_object_id, 
       dlc.target_object_id, 
       dlc.connection_data
     FROM `etl_log.vw_data_lineage_objects_connection` AS dlc
-    WHERE dlc.data_lineage_build_id LIKE '{build_id}'
-    AND dlc.subject_area LIKE '{domain}'
-    AND dlc.target_table_name LIKE '{job_build_id}'
-    AND dlc.data_lineage_type = '{dl_type}'
+    WHERE {conditions}
     """
+  DL_QUERY_FILTER_COLUMNS = {
+    "build_id": "data_lineage_build_id",
+    "domain": "subject_area",
+    "job_build_id": "target_table_name",
+    "dl_type": "data_lineage_type",
+  }
+  # query and data lineage type of each data lineage spec
+  DL_QUERY_SPECS = {
+    "project_level_objects": (DLO_QUERY, "PROJECT_LEVEL"),
+    "project_level_connections": (DLC_QUERY, "PROJECT_LEVEL"),
+    "domain_level_objects": (DLO_QUERY, "DOMAIN_LEVEL"),
+    "domain_level_connections": (DLC_QUERY, "DOMAIN_LEVEL"),
+    "query_level_objects": (DLO_QUERY, "QUERY_LEVEL"),
+    "query_level_connections": (DLC_QUERY, "QUERY_LEVEL"),
+  }
 
   AUTH_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
 
@@ -85,87 +147,160 @@ class BackendBQClient:
     self._auth()
     self.client = bigquery.Client(project=project)
 
-  def get_build_datetimes(self) -> List[str]:
-    query = self.BUILD_DATETIMES_QUERY.format()
-    result = self.client.query(query).result()
-    return [r[0] for r in result]
-
-  def get_build_id_by_datetime(self, datetime: str) -> List[str]:
-    query = self.DL_BUILD_ID_QUERY.format(datetime=datetime)
-    result = self.client.query(query).result()
-    return [r[0] for r in result][0]
+  def _run_query(self, query: str, **params: Tuple[str, Any]) -> Iterable:
+    """Runs a parameterized query and returns the result rows.
 
-  def get_domains(self, datetime: str) -> List[str]:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DOMAINS_QUERY.format(build_id=build_id)
-    result = self.client.query(query).result()
-    return [r[0] for r in result]
+    Args:
+      query (str): query text with @-prefixed named parameters.
+      **params: parameter name mapped to a (BQ type, value) pair.
+    Returns:
+      Iterable: result rows.
+    """
+    job_config = bigquery.QueryJobConfig(query_parameters=[
+      bigquery.ScalarQueryParameter(name, param_type, value)
+      for name, (param_type, value) in params.items()
+    ])
+    return self.client.query(query, job_config=job_config).result()
 
-  def get_job_build_ids(self, datetime: str, domain: str) -> List[str]:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.JOB_BUILD_IDS_QUERY.format(build_id=build_id,
-                                            domain=domain)
-    result = self.client.query(query).result()
-    return [r[0] for r in result]
+  def _run_dl_query(self, query: str, datetime: str, domain: str,
+                    job_build_id: str, dl_type: str) -> List:
+    """Runs a data lineage object or connection query for a build.
 
-  def get_project_level_objects(self, datetime: str) -> List:
+    Filters with "%" value match everything, so they are left out of the
+    query. Other filters use LIKE only if they contain a wildcard, so BQ can
+    prune clustered columns by equality.
+    """
     build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLO_QUERY.format(
-      build_id=build_id,
-      domain="%",
-      job_build_id="%",
-      dl_type="PROJECT_LEVEL",
+    if build_id is None:
+      return []
+    filters = {
+      "build_id": build_id,
+      "domain": domain,
+      "job_build_id": job_build_id,
+      "dl_type": dl_type,
+    }
+    params = {name: ("STRING", value) for name, value in filters.items()
+              if value != "%"}
+    conditions = "\n    AND ".join(
+      f"{self.DL_QUERY_FILTER_COLUMNS[name]} "
+      f"{'LIKE' if '%' in value else '='} @{name}"
+      for name, (_, value) in params.items()
     )
-    return list(self.client.query(query).result())
+    return list(self._run_query(query.format(conditions=conditions),
+                                **params))
 
-  def get_project_level_connections(self, datetime: str) -> List:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLC_QUERY.format(
-      build_id=build_id,
-      domain="%",
-      job_build_id="%",
-      dl_type="PROJECT_LEVEL",
-    )
-    return list(self.client.query(query).result())
+  @staticmethod
+  def _is_prefetched(cache_key: Hashable) -> bool:
+    """Checks if cache_key is already cached or being prefetched.
 
-  def get_domain_level_objects(self, datetime: str, domain: str) -> List:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLO_QUERY.format(
-      build_id=build_id,
-      domain=domain,
-      job_build_id="%",
-      dl_type="DOMAIN_LEVEL",
-    )
-    return list(self.client.query(query).result())
+    Must be called with _prefetch_in_flight_lock held.
+    """
+    return (cache_key in _prefetch_in_flight
+            or _prefetch_cache.get(cache_key) is not None)
 
-  def get_domain_level_connections(self, datetime: str, domain: str) -> List:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLC_QUERY.format(
-      build_id=build_id,
-      domain=domain,
-      job_build_id="%",
-      dl_type="DOMAIN_LEVEL",
-    )
-    return list(self.client.query(query).result())
+  def _prefetch(self, cache_key: Hashable, method: Callable,
+                *args, **kwargs) -> None:
+    """Runs method in the background to warm up the prefetch cache.
 
-  def get_query_level_objects(self, datetime: str, domain: str,
-                              job_build_id: str) -> List:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLO_QUERY.format(
-      build_id=build_id,
-      domain=domain,
-      job_build_id=job_build_id,
-      dl_type="QUERY_LEVEL",
-    )
-    return list(self.client.query(query).result())
+    Nothing is submitted if the result stored under cache_key is already
+    cached or being prefetched.
+    """
+    with _prefetch_in_flight_lock:
+      if self._is_prefetched(cache_key):
+        return
+      _prefetch_in_flight.add(cache_key)
 
-  def get_query_level_connections(self, datetime: str, domain: str,
-                                  job_build_id: str) -> List:
-    build_id = self.get_build_id_by_datetime(datetime)
-    query = self.DLC_QUERY.format(
-      build_id=build_id,
+    def _run() -> None:
+      try:
+        method(*args, **kwargs)
+      finally:
+        with _prefetch_in_flight_lock:
+          _prefetch_in_flight.discard(cache_key)
+
+    _prefetch_executor.submit(_run)
+
+  def _get_domains_cache_key(self, datetime: str) -> Tuple:
+    return self.project, "domains", datetime
+
+  def _get_job_build_ids_cache_key(self, datetime: str, domain: str) -> Tuple:
+    return self.project, "job_build_ids", datetime, domain
+
+  def get_build_datetimes(self) -> List[str]:
+    result = self._run_query(self.BUILD_DATETIMES_QUERY)
+    build_datetimes = [r[0] for r in result]
+    if build_datetimes:
+      # latest build is the one that is most likely to be opened next
+      self._prefetch(self._get_domains_cache_key(build_datetimes[0]),
+                     self.get_domains, build_datetimes[0], prefetch=False)
+    return build_datetimes
+
+  def get_build_id_by_datetime(self, datetime: str) -> Optional[str]:
+    result = self._run_query(self.DL_BUILD_ID_QUERY,
+                             datetime=("DATETIME", datetime))
+    row = next(iter(result), None)
+    return row[0] if row is not None else None
+
+  def get_domains(self, datetime: str, prefetch: bool = True) -> List[str]:
+    cache_key = self._get_domains_cache_key(datetime)
+    domains = _prefetch_cache.get(cache_key)
+    build_id = None
+    if domains is None:
+      build_id = self.get_build_id_by_datetime(datetime)
+      result = self._run_query(self.DOMAINS_QUERY,
+                               build_id=("STRING", build_id))
+      domains = [r[0] for r in result]
+      _prefetch_cache.set(cache_key, domains)
+    if prefetch:
+      with _prefetch_in_flight_lock:
+        pending_domains = [
+          domain for domain in domains if not self._is_prefetched(
+            self._get_job_build_ids_cache_key(datetime, domain))
+        ]
+      if pending_domains and build_id is None:
+        build_id = self.get_build_id_by_datetime(datetime)
+      for domain in pending_domains:
+        # build id is resolved once for all domains
+        self._prefetch(self._get_job_build_ids_cache_key(datetime, domain),
+                       self._get_job_build_ids, datetime, build_id, domain)
+    return domains
+
+  def get_job_build_ids(self, datetime: str, domain: str) -> List[str]:
+    cache_key = self._get_job_build_ids_cache_key(datetime, domain)
+    job_build_ids = _prefetch_cache.get(cache_key)
+    if job_build_ids is None:
+      build_id = self.get_build_id_by_datetime(datetime)
+      job_build_ids = self._get_job_build_ids(datetime, build_id, domain)
+    return job_build_ids
+
+  def _get_job_build_ids(self, datetime: str, build_id: Optional[str],
+                         domain: str) -> List[str]:
+    """Queries job build ids of a resolved build and caches them."""
+    result = self._run_query(self.JOB_BUILD_IDS_QUERY,
+                             build_id=("STRING", build_id),
+                             domain=("STRING", domain))
+    job_build_ids = [r[0] for r in result]
+    _prefetch_cache.set(
+      self._get_job_build_ids_cache_key(datetime, domain), job_build_ids)
+    return job_build_ids
+
+  def get_data_lineage_rows(self, spec_name: str, datetime: str,
+                            domain: str = "%",
+                            job_build_id: str = "%") -> List:
+    """Gets data lineage objects or connections described by a spec.
+
+    Args:
+      spec_name (str): key of DL_QUERY_SPECS.
+      datetime (str): datetime of the build.
+      domain (str): domain name, all domains by default.
+      job_build_id (str): job build id, all job build ids by default.
+    Returns:
+      List: result rows.
+    """
+    query, dl_type = self.DL_QUERY_SPECS[spec_name]
+    return self._run_dl_query(
+      query,
+      datetime=datetime,
       domain=domain,
       job_build_id=job_build_id,
-      dl_type="QUERY_LEVEL",
+      dl_type=dl_type,
     )
-    return list(self.client.query(query).result())
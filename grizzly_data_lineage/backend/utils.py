@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
 import json
+import os
 import sys
+import threading
+import time
 import traceback
 
 from flask import jsonify
@@ -23,47 +27,94 @@ import sql_graph
 from backend.bq import BackendBQClient
 from backend.validation import ValidationError
 
+WORKFLOW_CACHE_SIZE = 128
+WORKFLOW_CACHE_MIN_SECONDS = 0.5
+
+# object data keys that are converted to position and style
+_LAYOUT_DATA_KEYS = frozenset({"coordinates", "width", "height"})
+
+
+def _make_hashable(value):
+  if isinstance(value, dict):
+    return frozenset((k, _make_hashable(v)) for k, v in value.items())
+  if isinstance(value, list):
+    return tuple(_make_hashable(v) for v in value)
+  return value
+
+
+def cache_slow_calls(maxsize, min_seconds):
+  """Decorator that caches results of keyword-only calls in an LRU cache.
+
+  Only results of calls that took at least min_seconds are stored, so cheap
+  calls do not evict expensive ones.
+  """
+  def decorator(func):
+    cache = collections.OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(**kwargs):
+      key = _make_hashable(kwargs)
+      with lock:
+        if key in cache:
+          cache.move_to_end(key)
+          return cache[key]
+      start = time.perf_counter()
+      result = func(**kwargs)
+      if time.perf_counter() - start >= min_seconds:
+        with lock:
+          cache[key] = result
+          if len(cache) > maxsize:
+            cache.popitem(last=False)
+      return result
+
+    return wrapper
+
+  return decorator
+
 
 def _convert_bq_obj_to_rf(obj):
   data_dict = json.loads(obj["object_data"])
-  converted_obj = {
-    "id": obj["object_id"],
-    "parentNode": obj["parent_object_id"],
-    "data": {
-      "pythonType": obj["object_type"],
-      "domain": obj["subject_area"],
-      "target_table": obj["target_table_name"],
-    },
-    "position": {
-      "x": data_dict["coordinates"][0],
-      "y": data_dict["coordinates"][1],
-    },
-    "style": {
-      "width": data_dict["width"],
-      "height": data_dict["height"],
-    }
+  converted_obj = {"id": obj["object_id"]}
+  if obj["parent_object_id"] is not None:
+    converted_obj["parentNode"] = obj["parent_object_id"]
+  converted_obj["data"] = {
+    "pythonType": obj["object_type"],
+    "domain": obj["subject_area"],
+    "target_table": obj["target_table_name"],
+  }
+  converted_obj["position"] = {
+    "x": data_dict["coordinates"][0],
+    "y": data_dict["coordinates"][1],
+  }
+  converted_obj["style"] = {
+    "width": data_dict["width"],
+    "height": data_dict["height"],
   }
 
-  del data_dict["coordinates"]
-  del data_dict["width"]
-  del data_dict["height"]
-  converted_obj["data"].update(data_dict)
-
-  if obj["parent_object_id"] is None:
-    del converted_obj["parentNode"]
+  converted_obj["data"].update({k: v for k, v in data_dict.items()
+                                if k not in _LAYOUT_DATA_KEYS})
   return converted_obj
 
 
-def _convert_bq_conn_to_rf(conn):
+def _convert_bq_conn_to_rf(conn, connection_data):
   converted_conn = {
     "id": conn["source_object_id"] + "-" + conn["target_object_id"],
     "source": conn["source_object_id"],
     "target": conn["target_object_id"],
-    "data": json.loads(conn["connection_data"]),
+    "data": connection_data,
   }
   return converted_conn
 
 
+def _convert_bq_conns_to_rf(connections):
+  # parse all connection data blobs as one JSON array with a single call
+  connection_data_list = json.loads(
+    "[" + ",".join(conn["connection_data"] for conn in connections) + "]")
+  return [_convert_bq_conn_to_rf(conn, connection_data)
+          for conn, connection_data in zip(connections, connection_data_list)]
+
+
 def _sort_by_type(objects):
   def comp(t):
     if t.lower().endswith("table"):
@@ -77,20 +128,26 @@ def _sort_by_type(objects):
   return objects
 
 
-def bq_workflow(gcp_project, object_query_function, connection_query_function,
+# build data for a datetime does not change, so results can be reused
+@cache_slow_calls(maxsize=WORKFLOW_CACHE_SIZE,
+                  min_seconds=WORKFLOW_CACHE_MIN_SECONDS)
+def bq_workflow(gcp_project, object_query_spec, connection_query_spec,
                 query_args):
   client = BackendBQClient(gcp_project)
-  objects = getattr(client, object_query_function)(**query_args)
-  connections = getattr(client, connection_query_function)(**query_args)
+  objects = client.get_data_lineage_rows(object_query_spec, **query_args)
+  connections = client.get_data_lineage_rows(connection_query_spec,
+                                             **query_args)
   return {
     "objects": _sort_by_type([_convert_bq_obj_to_rf(obj) for obj in objects]),
-    "connections": [_convert_bq_conn_to_rf(conn) for conn in connections],
+    "connections": _convert_bq_conns_to_rf(connections),
   }
 
 
 def on_demand_workflow(gcp_project, datetime, domains, physical):
-  loader = sql_graph.GrizzlyLoader(gcp_project, datetime)
-  graph = sql_graph.Graph(loader.filter_queries_by_domain_list(domains))
+  loader = sql_graph.GrizzlyLoader(gcp_project, datetime,
+                                   max_workers=os.cpu_count())
+  graph = sql_graph.Graph(loader.filter_queries_by_domain_list(domains),
+                          max_workers=os.cpu_count())
   serializer = sql_graph.ReactFlowSerializer(graph, physical)
   return serializer.serialize()
 
@@ -12,11 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
 from flask import request
 from datetime import datetime as DateTime
 
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# like strptime with DATETIME_FORMAT, fields after the year need no padding
+# and date and time may be separated by any whitespace
+DATETIME_PATTERN = re.compile(
+  r"(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})")
+
 
 class ValidationError(Exception):
+  __slots__ = ("parameter", "message")
+
   def __init__(self, parameter, message):
     self.parameter = parameter
     self.message = message
@@ -34,11 +44,14 @@ def get_check_not_empty(param_name):
 
 
 def format_datetime(datetime):
-  datetime_format = "%Y-%m-%d %H:%M:%S"
-  try:
-    return DateTime.strptime(datetime, "%Y-%m-%d %H:%M:%S")
-  except ValueError:
-    raise ValidationError("datetime", f"must match {datetime_format}")
+  # building the datetime from regex groups is much faster than strptime
+  match = DATETIME_PATTERN.fullmatch(datetime)
+  if match is not None:
+    try:
+      return DateTime(*map(int, match.groups()))
+    except ValueError:
+      pass
+  raise ValidationError("datetime", f"must match {DATETIME_FORMAT}")
 
 
 def format_domain_list(domain_list):
@@ -61,8 +74,8 @@ def validate_parse_grizzly_project_args():
   datetime = format_datetime(get_check_not_empty("datetime"))
   return {
     "gcp_project": gcp_project,
-    "object_query_function": "get_project_level_objects",
-    "connection_query_function": "get_project_level_connections",
+    "object_query_spec": "project_level_objects",
+    "connection_query_spec": "project_level_connections",
     "query_args": {
       "datetime": datetime,
     },
@@ -75,8 +88,8 @@ def validate_parse_grizzly_domain_args():
   domain = get_check_not_empty("domain")
   return {
     "gcp_project": gcp_project,
-    "object_query_function": "get_domain_level_objects",
-    "connection_query_function": "get_domain_level_connections",
+    "object_query_spec": "domain_level_objects",
+    "connection_query_spec": "domain_level_connections",
     "query_args": {
       "datetime": datetime,
       "domain": domain
@@ -91,8 +104,8 @@ def validate_parse_grizzly_query_args():
   job_build_id = get_check_not_empty("job_build_id")
   return {
     "gcp_project": gcp_project,
-    "object_query_function": "get_query_level_objects",
-    "connection_query_function": "get_query_level_connections",
+    "object_query_spec": "query_level_objects",
+    "connection_query_spec": "query_level_connections",
     "query_args": {
       "datetime": datetime,
       "domain": domain,
@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-class ParsingError(Exception): pass
-class UnknownScenario(ParsingError): pass
-class UnsupportedTypeError(ParsingError): pass
-class SerializingParamsNotReady(ParsingError): pass
-class ParsingLookupError(ParsingError): pass
-class ColumnLookupError(ParsingLookupError): pass
-class TableLookupError(ParsingLookupError): pass
-class LoadingError(ParsingError): pass
+class ParsingError(Exception): __slots__ = ()
+class UnknownScenario(ParsingError): __slots__ = ()
+class UnsupportedTypeError(ParsingError): __slots__ = ()
+class SerializingParamsNotReady(ParsingError): __slots__ = ()
+class ParsingLookupError(ParsingError): __slots__ = ()
+class ColumnLookupError(ParsingLookupError): __slots__ = ()
+class TableLookupError(ParsingLookupError): __slots__ = ()
+class LoadingError(ParsingError): __slots__ = ()
@@ -19,7 +19,7 @@ client = GrizzlyBQClient(project)
 client.get_build_files(subject_area)
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from datetime import datetime as DateTime
 
 import google.auth.transport.requests
@@ -121,13 +121,16 @@ class GrizzlyBQClient:
     result = self.client.query(query).result()
     return [r[0] for r in result]
 
-  def get_build_files(self, datetime: str) -> List:
+  def get_build_files(self, datetime: str) -> Iterable:
     """Method that gets all build files for a particular datetime.
 
+    Rows are streamed, so they can be processed while BQ is still
+    returning further pages. The result can be iterated only once.
+
     Args:
       datetime (str): datetime string.
     Returns:
-      List[str]: list of build files and info about them.
+      Iterable: rows with build files and info about them.
     """
     query = self.BUILD_FILES_ON_DATETIME_QUERY.format(datetime=datetime)
-    return list(self.client.query(query).result())
+    return self.client.query(query).result()
@@ -14,7 +14,8 @@
 
 """Domain class."""
 
-from typing import List, Dict
+from collections import defaultdict
+from typing import Dict, Iterable, List
 
 from sql_graph.loading.task import Task
 from sql_graph.parsing import Query
@@ -29,19 +30,21 @@ class Domain:
     tasks (dict): dictionary of tasks.
   """
 
+  __slots__ = ("name", "tasks")
+
   @staticmethod
-  def _group_rows_by_task(queried_files_rows: List) -> Dict:
+  def _group_rows_by_task(queried_files_rows: Iterable) -> Dict:
     """Groups rows into a dictionary with task ID as the key.
 
     Args:
-      queried_files_rows (List): list of rows with file descriptions.
+      queried_files_rows (Iterable): rows with file descriptions.
     Returns:
       Dict: rows grouped by task.
     """
-    rows_grouped_by_task = {}
+    rows_grouped_by_task = defaultdict(list)
     for item in queried_files_rows:
-      rows_grouped_by_task.setdefault(item["job_build_id"], []).append(item)
-    return rows_grouped_by_task
+      rows_grouped_by_task[item["job_build_id"]].append(item)
+    return dict(rows_grouped_by_task)
 
   def make_query_from_task(self, task: Task) -> TQuery:
     """Creates a query object from task.
@@ -59,7 +62,7 @@ class Domain:
       descriptions=task.descriptions,
     )
 
-  def __init__(self, name: str, queried_files_rows: List) -> None:
+  def __init__(self, name: str, queried_files_rows: Iterable) -> None:
     self.name = name
     self.tasks = {}
 
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as DateTime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sql_graph.loading.domain import Domain
 from sql_graph.loading.bq import GrizzlyBQClient
@@ -27,13 +29,25 @@ class GrizzlyLoader:
   Includes Grizzly specific attributes and methods.
   Can be reused multiple times.
 
+  Domain objects are built lazily, the first time a domain's tasks or
+  queries are requested. A domain that fails to build is reported once,
+  left out of get_domains and treated as having no tasks.
+
   Attributes:
     gcp_project (str): name of the GCP project.
     datetime (DateTime): datetime of the build, which can be used
       to retrieve SQL files from past deployments.
     _client (GrizzlyBQClient): GrizzlyBQClient instance for SQL queries.
-    _domains (Dict[str, Domain]): dictionary of domains with domain names as
-      keys and domain objects as values.
+    _domain_rows (Dict[str, List]): build files rows grouped by domain name.
+    _domains (Dict[str, Optional[Domain]]): dictionary of domains that were
+      already built, with domain names as keys and domain objects (or None
+      if building failed) as values.
+    _max_workers (int or None): number of threads used to build several
+      domains at once. If None, domains are built sequentially.
+    _sorted_domain_names (Tuple[str, ...]): names of all domains in
+      alphabetical order.
+    _queries_by_domain (Dict[str, List[TQuery]]): query objects of each
+      domain that was already requested.
   """
 
   def _group_build_files_rows_by_domain(self) -> Dict:
@@ -42,41 +56,98 @@ class GrizzlyLoader:
     Returns:
       Dict: rows grouped by domain.
     """
-    rows_grouped_by_domain = {}
+    rows_grouped_by_domain = defaultdict(list)
     for item in self._build_files_rows:
-      rows_grouped_by_domain.setdefault(item["subject_area"], []).append(item)
-    return rows_grouped_by_domain
-
-  def _build_domains(self) -> None:
-    """Builds Domain objects from build files grouped by domain name."""
-    rows_grouped_by_domain = self._group_build_files_rows_by_domain()
-    for domain_name in rows_grouped_by_domain.keys():
-      try:
-        self._domains[domain_name] = Domain(
-          name=domain_name,
-          queried_files_rows=rows_grouped_by_domain[domain_name]
-        )
-      except Exception as e:
-        print(f"Failed to get data for {domain_name} with error: {e}")
-
-  def __init__(self, gcp_project: str, datetime: DateTime) -> None:
+      rows_grouped_by_domain[item["subject_area"]].append(item)
+    return dict(rows_grouped_by_domain)
+
+  @staticmethod
+  def _build_domain(domain_name: str,
+                    domain_rows: List) -> Optional[Domain]:
+    """Builds a single Domain object, reporting failures instead of raising.
+
+    Args:
+      domain_name (str): name of the domain.
+      domain_rows (List): build files rows of the domain.
+    Returns:
+      Optional[Domain]: domain object, or None if it could not be built.
+    """
+    try:
+      return Domain(name=domain_name, queried_files_rows=domain_rows)
+    except Exception as e:
+      print(f"Failed to get data for {domain_name} with error: {e}")
+      return None
+
+  def _build_domains(self, domain_names: Iterable[str]) -> None:
+    """Builds Domain objects that were not built yet.
+
+    If max_workers is set, domains are built in a thread pool.
+
+    Args:
+      domain_names (Iterable[str]): names of the domains to build.
+    """
+    domain_names = [n for n in domain_names if n not in self._domains]
+    domain_rows = [self._domain_rows[n] for n in domain_names]
+    if self._max_workers is None or len(domain_names) < 2:
+      domains = map(self._build_domain, domain_names, domain_rows)
+    else:
+      with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+        domains = list(executor.map(self._build_domain, domain_names,
+                                    domain_rows))
+    for domain_name, domain in zip(domain_names, domains):
+      self._domains[domain_name] = domain
+
+  def _get_domain(self, domain_name: str) -> Optional[Domain]:
+    """Returns a domain object, building it on first access.
+
+    Args:
+      domain_name (str): name of the domain.
+    Returns:
+      Optional[Domain]: domain object, or None if it could not be built.
+    """
+    if domain_name not in self._domains:
+      self._build_domains([domain_name])
+    return self._domains[domain_name]
+
+  def _get_domain_queries(self, domain_name: str) -> List[TQuery]:
+    """Returns query objects of a domain, building them on first access.
+
+    Args:
+      domain_name (str): name of the domain.
+    Returns:
+      List[TQuery]: queries and info about them.
+    """
+    if domain_name not in self._queries_by_domain:
+      domain = self._get_domain(domain_name)
+      queries = domain.get_queries() if domain is not None else []
+      self._queries_by_domain[domain_name] = queries
+    return self._queries_by_domain[domain_name]
+
+  def __init__(self, gcp_project: str, datetime: DateTime,
+               max_workers: Optional[int] = None) -> None:
     self.gcp_project = gcp_project
     self._client = GrizzlyBQClient(self.gcp_project)
     self.datetime = datetime
-    self._domains: Dict[str, Domain] = {}
+    self._domains: Dict[str, Optional[Domain]] = {}
+    self._max_workers = max_workers
 
     self._build_files_rows = self._client.get_build_files(str(self.datetime))
-    self._table_metadata = dict()
-    self._column_metadata = dict()
-    self._build_domains()
+    self._domain_rows = self._group_build_files_rows_by_domain()
+    self._sorted_domain_names: Tuple[str, ...] = tuple(
+      sorted(self._domain_rows))
+    self._queries_by_domain: Dict[str, List[TQuery]] = {}
 
   def get_domains(self) -> List[str]:
     """Returns a list of all domain names that are loaded.
 
+    Builds all domains, so that domains that fail to build are left out.
+
     Returns:
       List[str]: list of domain names for selected datetime.
     """
-    return list(self._domains.keys())
+    self._build_domains(self._domain_rows)
+    return [domain_name for domain_name in self._domain_rows
+            if self._domains[domain_name] is not None]
 
   def get_job_build_ids(self, domain_name: str) -> List[str]:
     """Returns a list of all job build IDs for a domain.
@@ -86,7 +157,18 @@ class GrizzlyLoader:
     Returns:
       List[str]: list of job build IDs.
     """
-    return list(self._domains[domain_name].tasks.keys())
+    domain = self._get_domain(domain_name)
+    return list(domain.tasks.keys()) if domain is not None else []
+
+  def iter_queries(self) -> Iterator[TQuery]:
+    """Iterates over query objects from all domains ordered by domain name.
+
+    Yields:
+      TQuery: queries and info about them.
+    """
+    self._build_domains(self._sorted_domain_names)
+    for domain_name in self._sorted_domain_names:
+      yield from self._get_domain_queries(domain_name)
 
   def get_queries(self) -> List[TQuery]:
     """Returns query objects from all domains ordered by domain name.
@@ -94,10 +176,28 @@ class GrizzlyLoader:
     Returns:
       List[TQuery]: queries and info about them.
     """
-    queries = []
-    for domain_name in sorted(self._domains.keys()):
-      queries.extend(self._domains[domain_name].get_queries())
-    return queries
+    return list(self.iter_queries())
+
+  def iter_queries_by_domain_list(self,
+                                  domain_list: List[str]) -> Iterator[TQuery]:
+    """Iterates over query objects from only selected domains.
+
+    Args:
+      domain_list (List[str]): list of domain names to include.
+        If a name on the list was not loaded it will be ignored.
+    Yields:
+      TQuery: queries and info about them.
+    """
+    if not domain_list:
+      yield from self.iter_queries()
+      return
+
+    # walk only the requested domains, keeping the sorted-by-name order
+    domain_names = [n for n in sorted(set(domain_list))
+                    if n in self._domain_rows]
+    self._build_domains(domain_names)
+    for domain_name in domain_names:
+      yield from self._get_domain_queries(domain_name)
 
   def filter_queries_by_domain_list(self,
                                     domain_list: List[str]) -> List[TQuery]:
@@ -109,13 +209,7 @@ class GrizzlyLoader:
     Returns:
       List[TQuery]: queries and info about them.
     """
-    queries = []
-    do_filtering = len(domain_list) > 0
-
-    for domain_name in sorted(self._domains.keys()):
-      if (do_filtering and domain_name in domain_list) or not do_filtering:
-        queries.extend(self._domains[domain_name].get_queries())
-    return queries
+    return list(self.iter_queries_by_domain_list(domain_list))
 
   def filter_queries_by_job_build_id(self, domain_name: str,
                                      job_build_id: str) -> List[TQuery]:
@@ -127,4 +221,7 @@ class GrizzlyLoader:
     Returns:
       List[TQuery]: queries and info about them.
     """
-    return self._domains[domain_name].filter_queries_by_task_id(job_build_id)
+    domain = self._get_domain(domain_name)
+    if domain is None:
+      return []
+    return domain.filter_queries_by_task_id(job_build_id)
@@ -15,11 +15,22 @@
 """Task instance class."""
 
 import pathlib
+import re
 from typing import Dict
 import yaml
 
 from sql_graph.exceptions import ParsingError
 
+# use libyaml bindings if PyYAML was built with them
+try:
+  from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+  from yaml import SafeLoader as _YamlSafeLoader
+
+# escaped newlines and quotes in stored query files
+_QUERY_ESCAPE_PATTERN = re.compile(r"\\n|\\\"")
+_QUERY_ESCAPE_REPLACEMENTS = {r"\n": "\n", "\\\"": "\""}
+
 
 class Task:
   """Class representing a Grizzly task instance.
@@ -29,24 +40,31 @@ class Task:
       files (Dict[str, str]): dictionary of all task files, where paths are
         the keys, and values are file contents.
       config_path (pathlib.Path): path object of the .yml config file.
+      config_dir (pathlib.Path): directory of the config file. Paths in the
+        config are relative to it.
       target_table_name (str): name of the target table.
       job_write_mode (str): job write mode of the query.
       descriptions (Dict): dictionary with table and column descriptions.
       query (str): stage loading query of the task.
   """
 
-  def _find_config_file(self) -> pathlib.Path:
+  __slots__ = ("task_id", "files", "config_path", "config_dir", "raw_config",
+               "target_table_name", "job_write_mode", "descriptions", "query")
+
+  def _find_config_file(self) -> str:
     """Looks up the confing file in the files list.
 
     Config file is the one and only one file that ends with a .yml.
 
     Returns:
-      pathlib.Path: path object of the config file.
+      str: path of the config file, as used as a key of files.
     """
-    for path in self.files:
-      if path.endswith(self.task_id + ".yml"):
-        return pathlib.Path(path)
-    raise ParsingError(f"Config file was not found for task {self.task_id}")
+    config_suffix = self.task_id + ".yml"
+    config_path = next(
+      (path for path in self.files if path.endswith(config_suffix)), None)
+    if config_path is None:
+      raise ParsingError(f"Config file was not found for task {self.task_id}")
+    return config_path
 
   def _get_query(self) -> str:
     """Returns the query string if it is present.
@@ -54,20 +72,24 @@ class Task:
     Returns:
       str: query string.
     """
-    if "stage_loading_query" in self.raw_config:
-      query_path = pathlib.Path(self.raw_config["stage_loading_query"])
-      query_path = self.config_path.parent / query_path
-      query = self.files[str(query_path)]
-      query = query.replace(r"\n", "\n").replace("\\\"", "\"")[1:-1]
-      return query
-    return ""
+    stage_loading_query = self.raw_config.get("stage_loading_query")
+    if stage_loading_query is None:
+      return ""
+    query_path = self.config_dir / stage_loading_query
+    query = self.files[str(query_path)]
+    # unescape newlines and quotes in a single pass over the query
+    query = _QUERY_ESCAPE_PATTERN.sub(
+      lambda m: _QUERY_ESCAPE_REPLACEMENTS[m.group(0)], query)
+    return query[1:-1]
 
   def __init__(self, task_id: str, files: Dict[str, str]) -> None:
     self.task_id = task_id
     self.files = files
 
-    self.config_path = self._find_config_file()
-    self.raw_config = yaml.safe_load(self.files[str(self.config_path)])
+    config_file = self._find_config_file()
+    self.config_path = pathlib.Path(config_file)
+    self.config_dir = self.config_path.parent
+    self.raw_config = yaml.load(self.files[config_file], Loader=_YamlSafeLoader)
     self.target_table_name = self.raw_config.get("target_table_name", None)
     self.job_write_mode = self.raw_config.get("job_write_mode", None)
     self.descriptions = self.raw_config.get("descriptions", None)
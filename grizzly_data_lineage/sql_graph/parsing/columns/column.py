@@ -14,7 +14,8 @@
 
 """Abstract column class."""
 import abc
-from typing import List
+import re
+from typing import Dict
 
 from sql_graph.exceptions import ParsingLookupError
 from sql_graph.exceptions import UnknownScenario
@@ -25,6 +26,11 @@ from sql_graph.typing import TColumn
 from sql_graph.typing import TTable
 from sql_graph.typing import TokenizedJson
 
+# dot separated names that can refer to a column, optionally qualified by
+# table, dataset and project (project IDs may contain dashes). Backticked
+# names are tokenized with double dots (`p.d.t`.a -> p..d..t.a).
+_IDENTIFIER_PATTERN = re.compile(r"[\w\-]+(?:\.{1,2}[\w\-]+)*")
+
 
 class Column(GridItem, abc.ABC):
   """Abstract class that represents a Column.
@@ -39,21 +45,31 @@ class Column(GridItem, abc.ABC):
       level lineage parsing.
     VIRTUAL_TABLE_TAGS (Set[str]): set of tags that will be treated as a virtual
       table if found in JSON value of the column.
+    TAG_ARGUMENT_INDEXES (Dict[str, int]): mapping from sql function tags to
+      the index of the only argument that will be parsed for sources.
 
   Attributes:
     name (str): name of the column to distinguish it from other columns.
       It will also be used for serializing label.
     table (Table): table object where the column is located
-    _potential_source_names (List[str]): list of potential source column names.
-      An attempt to add them again will be done during column recalculation.
-    _sources_added_by_name (List[TColumn]): list of source columns that were
-      looked up by their name. They will be removed and re-added during
-      recalculation.
+    _potential_source_names (Dict[str, None]): potential source column names
+      in insertion order, stored as dict keys to drop duplicates. An attempt
+      to add them again will be done during column recalculation.
+    _sources_added_by_name (Dict[TColumn, None]): source columns that were
+      looked up by their name, stored as dict keys in insertion order. They
+      will be removed and re-added during recalculation.
   """
 
+  __slots__ = ("name", "table", "_potential_source_names",
+               "_sources_added_by_name")
+
   IGNORED_TAGS = {"literal", "count"}
   VIRTUAL_TABLE_TAGS = {"select", "select_distinct", "union", "union_all",
                         "unnest"}
+  TAG_ARGUMENT_INDEXES = {"regexp_extract": 0, "extract": 1,
+                          "timestamp_trunc": 0, "date_diff": 0,
+                          "datetime_diff": 0, "timestamp_diff": 0,
+                          "interval": 0}
   WIDTH = COLUMN_WIDTH
   VERTICAL_MARGIN = COLUMN_VERTICAL_MARGIN
 
@@ -65,16 +81,11 @@ class Column(GridItem, abc.ABC):
     Args:
       source_name (str): name of the source column.
     """
-    from sql_graph.parsing.tables import lookup_source
-
-    if not self.table.get_sources():
+    if not self.table.has_sources():
       return  # do not attempt lookup if parent table has no sources
-    table_name, column_name = lookup_source(self.table, source_name)
-    source_table = self.table.namespace.get_table_by_name(table_name)
-    source_column = source_table.columns[column_name]
+    source_column = self.table.namespace.lookup_source_column(source_name)
     self.add_source(source_column)
-    if source_column not in self._sources_added_by_name:
-      self._sources_added_by_name.append(source_column)
+    self._sources_added_by_name.setdefault(source_column, None)
 
   def _add_virtual_table(self, info: TokenizedJson) -> None:
     """Creates virtual table and adds its only column as a source.
@@ -90,74 +101,61 @@ class Column(GridItem, abc.ABC):
       raise UnknownScenario("Virtual table created from column SELECT statement"
                             f" in {self} cannot have more that one column.")
 
-  def _parse_tag_json(self, tag_key: str, tag_json: TokenizedJson) -> None:
-    """Parses tags related to sql functions with specific logic.
-
-    Args:
-      tag_key (str): name of the tag (function).
-      tag_json (TokenizedJson): value of the tag.
-    """
-    if tag_key in self.IGNORED_TAGS:
-      return
-    elif isinstance(tag_json, list):
-      # if tag is recognized, parse only specific arguments
-      if tag_key == "regexp_extract":
-        self._parse_value_json(tag_json[0])
-      elif tag_key == "extract":
-        self._parse_value_json(tag_json[1])
-      elif tag_key == "timestamp_trunc" and isinstance(tag_json, list):
-        self._parse_value_json(tag_json[0])
-      elif tag_key == "date_diff" and isinstance(tag_json, list):
-        self._parse_value_json(tag_json[0])
-      elif tag_key == "datetime_diff" and isinstance(tag_json, list):
-        self._parse_value_json(tag_json[0])
-      elif tag_key == "timestamp_diff" and isinstance(tag_json, list):
-        self._parse_value_json(tag_json[0])
-      elif tag_key == "interval" and isinstance(tag_json, list):
-        self._parse_value_json(tag_json[0])
-      else:
-        # if tag was not recognized, parse all arguments
-        self._parse_value_json(tag_json)
-    else:
-      # if tag was not recognized, parse all arguments
-      self._parse_value_json(tag_json)
-
   def _parse_value_json(self, value_json: TokenizedJson) -> None:
     """Parses a tokenized JSON and adds all sources it can locate.
 
+    The JSON tree is walked with an explicit stack instead of recursion.
+    Children are pushed in reverse, so nodes are visited in the same order
+    as in a depth-first recursive walk.
+
     Args:
       value_json (TokenizedJson): tokenized JSON representing column value.
     """
-    if isinstance(value_json, dict):
-      # if select is present, move its contents to a virtual table
-      if any([t in self.VIRTUAL_TABLE_TAGS for t in value_json]):
-        self._add_virtual_table(value_json)
+    ignored_tags = self.IGNORED_TAGS
+    virtual_table_tags = self.VIRTUAL_TABLE_TAGS
+    tag_argument_indexes = self.TAG_ARGUMENT_INDEXES
+    stack = [value_json]
+    while stack:
+      node = stack.pop()
+      if isinstance(node, dict):
+        # if select is present, move its contents to a virtual table
+        if not virtual_table_tags.isdisjoint(node):
+          self._add_virtual_table(node)
+          continue
+        for tag_key in reversed(node):
+          if tag_key in ignored_tags:
+            continue
+          tag_json = node[tag_key]
+          # if tag is recognized, parse only specific argument,
+          # otherwise parse all arguments
+          argument_index = tag_argument_indexes.get(tag_key)
+          if argument_index is not None and isinstance(tag_json, list):
+            stack.append(tag_json[argument_index])
+          else:
+            stack.append(tag_json)
+      elif isinstance(node, list):
+        stack.extend(reversed(node))
+      elif isinstance(node, str):
+        # strings that cannot be identifiers are never looked up
+        if not _IDENTIFIER_PATTERN.fullmatch(node):
+          continue
+        # attempt to find a source by string or number
+        self._potential_source_names[node] = None
+        try:
+          self._add_source_by_name(node)
+        except ParsingLookupError:
+          print(f"Could not lookup source from `{node}` in value of {self}")
+      elif node is None or isinstance(node, (int, float)):
+        pass
       else:
-        for tag_key in value_json:
-          self._parse_tag_json(tag_key, value_json[tag_key])
-    elif isinstance(value_json, list):
-      # recursively parse all elements
-      for item in value_json:
-        self._parse_value_json(item)
-    elif isinstance(value_json, str):
-      # attempt to find a source by string or number
-      self._potential_source_names.append(value_json)
-      try:
-        self._add_source_by_name(value_json)
-      except ParsingLookupError:
-          print(f"Could not lookup source from `{value_json}` "
-                f"in value of {self}")
-    elif value_json is None or isinstance(value_json, (int, float)):
-      pass
-    else:
-      print(f"Don't know how to parse: {value_json} in value of {self}")
+        print(f"Don't know how to parse: {node} in value of {self}")
 
   def __init__(self, name: str, table: TTable) -> None:
     super(Column, self).__init__()
     self.name = name
     self.table = table
-    self._potential_source_names: List[str] = []
-    self._sources_added_by_name: List[TColumn] = []
+    self._potential_source_names: Dict[str, None] = {}
+    self._sources_added_by_name: Dict[TColumn, None] = {}
 
   def __repr__(self):
     """Representation of the class in print for debug purposes."""
@@ -190,7 +188,7 @@ class Column(GridItem, abc.ABC):
       new_table (Table): cycle breaker table that will be used as a replacement.
     """
     for source_column in self.get_sources():
-      if source_column.table == old_table:
+      if source_column.table is old_table:
         self.remove_source(source_column)
         self.add_source(new_table.columns[source_column.name])
 
@@ -200,13 +198,13 @@ class Column(GridItem, abc.ABC):
     If the source is not physical, replace it with the list of its sources.
     """
     super(Column, self).relink_to_physical_ancestors()
-    physical_sources = []
+    physical_sources: Dict[TColumn, None] = {}
     for source in self._sources:
       if source.table.physical:
-        physical_sources.append(source)
+        physical_sources[source] = None
       else:
-        physical_sources.extend(source.get_sources())
-    self.replace_sources(physical_sources)
+        physical_sources.update(dict.fromkeys(source.get_sources()))
+    self.replace_sources(list(physical_sources))
 
   def _get_label(self) -> str:
     """Override of _get_label. Returns column name."""
@@ -215,5 +213,4 @@ class Column(GridItem, abc.ABC):
   def _calculate_serializing_params(self) -> None:
     """Override of _calculate_serializing_params method."""
     super(Column, self)._calculate_serializing_params()
-    for source in self._sources:
-      self.add_connection(source)
+    self.add_connections(self._sources)
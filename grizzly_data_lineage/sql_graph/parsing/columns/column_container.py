@@ -13,7 +13,6 @@
 # limitations under the License.
 
 """Column container class."""
-from collections import defaultdict
 from typing import List, Dict, Union, Optional
 from typing import Set
 
@@ -28,11 +27,20 @@ from sql_graph.parsing.primitives.settings import \
   COLUMN_CONTAINER_HORIZONTAL_MARGIN
 from sql_graph.parsing.primitives.settings import \
   COLUMN_CONTAINER_VERTICAL_MARGIN
+from sql_graph.typing import TStarColumn
 from sql_graph.typing import TokenizedJson
 from sql_graph.typing import TTable
 from sql_graph.typing import TTableColumn
 
 
+def _check_single_table_star_syntax(column_info: TokenizedJson) -> bool:
+  """Checks if column info copies all columns of one table (`table.*`)."""
+  if column_info.__class__ is not dict:
+    return False
+  value = column_info.get("value")
+  return value.__class__ is str and value.endswith(".*")
+
+
 class ColumnContainer(Container):
   """Class for storage of columns in a table.
 
@@ -44,16 +52,22 @@ class ColumnContainer(Container):
     star_column (StarColumn): column that represents missing info about the
       table. Can be initialized by external table or can be carried over from
       another table with initialized _star_column if SELECT * syntax is used.
+      Is created on first access.
     _column_dict (Dict[str, TableColumn): dictionary of columns with their names
       as keys. Is protected to prevent outside changes.
-    _column_order_list (List[str]): list of column names in order. Is protected
+    _column_list (List[TableColumn]): list of columns in order. Is protected
       to prevent outside changes.
     _columns_by_source (Dict[Set[str]]): dict that keeps track of column names
       added from each source. Will be used during copy recalculation.
+    _name_suffix_counters (Dict[Optional[str], int]): next suffix number to
+      try for each duplicated column name (None for unnamed columns).
     _label (str): label of the ColumnContainer. May change depending on the
       parsing method called.
   """
 
+  __slots__ = ("table", "_star_column", "_column_dict", "_column_list",
+               "_columns_by_source", "_name_suffix_counters", "_label")
+
   HORIZONTAL_MARGIN = COLUMN_CONTAINER_HORIZONTAL_MARGIN
   VERTICAL_MARGIN = COLUMN_CONTAINER_VERTICAL_MARGIN
   CHILD_SPACING = COLUMN_CONTAINER_CHILD_SPACING
@@ -61,14 +75,28 @@ class ColumnContainer(Container):
   def __init__(self, table: TTable) -> None:
     super(ColumnContainer, self).__init__()
     self.table = table
-    self.star_column = StarColumn(table=self.table)
+    self._star_column: Optional[TStarColumn] = None
 
     self._column_dict: Dict[str, TTableColumn] = {}
-    self._column_order_list: List[str] = []
-    self._columns_by_source: Dict[Set[str]] = defaultdict(set)
+    self._column_list: List[TTableColumn] = []
+    self._columns_by_source: Dict[Set[str]] = {}
+    self._name_suffix_counters: Dict[Optional[str], int] = {}
 
     self._label = "Columns"
 
+  @property
+  def star_column(self) -> TStarColumn:
+    """Star column of the table. Is created the first time it is requested."""
+    if self._star_column is None:
+      self._star_column = StarColumn(table=self.table)
+    return self._star_column
+
+  @property
+  def star_column_initialized(self) -> bool:
+    """Whether star column is initialized, without creating it if missing."""
+    star_column = self._star_column
+    return star_column is not None and star_column.initialized
+
   def __getitem__(self, key: Optional[Union[str, int]]) -> TTableColumn:
     """Method that allows dictionary_like item access with [].
 
@@ -80,22 +108,41 @@ class ColumnContainer(Container):
     Returns:
       TableColumn
     """
-    try:
-      if isinstance(key, str):  # get column by name
-        return self._column_dict[key]
-      elif isinstance(key, int):  # get column by order number
-        column_name = self._column_order_list[key]
-        return self._column_dict[column_name]
-      elif key is None:  # treat None as lookup error
-        raise ColumnLookupError(None)
-      else:
+    key_getter = self._KEY_GETTERS.get(type(key))
+    if key_getter is None:
+      # subclasses of the supported key types take the slower path
+      key_getter = next((getter for key_type, getter
+                         in self._KEY_GETTERS.items()
+                         if isinstance(key, key_type)), None)
+      if key_getter is None:
         raise UnsupportedTypeError(type(key))
+    try:
+      return key_getter(self, key)
     except (KeyError, IndexError, ColumnLookupError) as e:
-      if self.star_column.initialized:
-        return self.star_column
+      if self.star_column_initialized:
+        return self._star_column
       else:
         raise ColumnLookupError(key) from e
 
+  def _get_column_by_name(self, key: str) -> TTableColumn:
+    """Returns a column by name."""
+    return self._column_dict[key]
+
+  def _get_column_by_index(self, key: int) -> TTableColumn:
+    """Returns a column by order number."""
+    return self._column_list[key]
+
+  def _get_column_by_none(self, key: None) -> TTableColumn:
+    """Treats None as a lookup error."""
+    raise ColumnLookupError(key)
+
+  # getters used by __getitem__, looked up by the exact type of the key
+  _KEY_GETTERS = {
+    str: _get_column_by_name,
+    int: _get_column_by_index,
+    type(None): _get_column_by_none,
+  }
+
   def __repr__(self):
     """Representation of the class in print for debug purposes."""
     return f"<Column Container @ {self.table}>"
@@ -111,16 +158,22 @@ class ColumnContainer(Container):
     Returns:
       str: validated name.
     """
-    cnt = 0
     if name is None:
       name_template = "f{cnt}_"
-      new_name = name_template.format(cnt=cnt)
+      first_cnt = 0
+    elif name not in self._column_dict:
+      return name
     else:
       name_template = name + "_{cnt}"
-      new_name = name
+      first_cnt = 1
+    # columns are never removed, so suffixes that were taken before are
+    # still taken and the search can resume where it stopped last time
+    cnt = self._name_suffix_counters.get(name, first_cnt)
+    new_name = name_template.format(cnt=cnt)
     while new_name in self._column_dict:
       cnt += 1
       new_name = name_template.format(cnt=cnt)
+    self._name_suffix_counters[name] = cnt + 1
     return new_name
 
   def add_column(self, column: TTableColumn) -> None:
@@ -131,10 +184,12 @@ class ColumnContainer(Container):
     """
     column.name = self._validate_column_name(column.name)
     self._column_dict[column.name] = column
-    self._column_order_list.append(column.name)
+    self._column_list.append(column)
     # if column has just one source, record it in _columns_by_source
-    if len(column.get_sources()) == 1:
-      self._columns_by_source[column.get_sources()[0]].add(column.name)
+    column_sources = column.get_sources()
+    if len(column_sources) == 1:
+      self._columns_by_source.setdefault(column_sources[0], set()).add(
+        column.name)
 
   def _create_column(self, column_info: TokenizedJson) -> TTableColumn:
     """Method that extracts name and value from column info and creates column.
@@ -162,12 +217,12 @@ class ColumnContainer(Container):
     Args:
       source_name (str): name of the source.
     """
-    source = self.table.namespace.get_table_by_name(name=source_name)
-    for column in source.columns:
-      if isinstance(column, StarColumn):
-        self.star_column.add_source(source=column)
-      else:
-        self.add_column(column.copy(self.table))
+    source_columns = self.table.namespace.get_table_by_name(
+      name=source_name).columns
+    if source_columns.star_column_initialized:
+      self.star_column.add_source(source=source_columns.star_column)
+    for column in source_columns._column_list:
+      self.add_column(column.copy(self.table))
 
   def _copy_columns_from_all_sources(self) -> None:
     """Copies all columns from all sources.
@@ -188,13 +243,14 @@ class ColumnContainer(Container):
     new_columns_added = False
     new_source = self.table.namespace.get_table_by_name(source_to_redo.name)
     self.star_column.remove_source(source_to_redo.columns.star_column)
-    for column in new_source.columns:
-      if isinstance(column, StarColumn):
-        self.star_column.add_source(column)
-      else:
-        if column.name not in self._columns_by_source[new_source.name]:
-          self.add_column(column.copy(self.table))
-          new_columns_added = True
+    new_source_columns = new_source.columns
+    if new_source_columns.star_column_initialized:
+      self.star_column.add_source(new_source_columns.star_column)
+    copied_names = self._columns_by_source.get(new_source.name, ())
+    for column in new_source_columns._column_list:
+      if column.name not in copied_names:
+        self.add_column(column.copy(self.table))
+        new_columns_added = True
     return new_columns_added
 
   def parse_select(self, select_type: str, select_info: TokenizedJson) -> None:
@@ -205,17 +261,13 @@ class ColumnContainer(Container):
       select_info (TokenizedJsonDict): JSON wih information about
         table's select.
     """
-    def check_single_table_star_syntax(ci: TokenizedJson) -> bool:
-      return isinstance(ci, dict) and "value" in ci \
-             and isinstance(ci["value"], str) and ci["value"].endswith(".*")
-
     self._label = select_type
     if isinstance(select_info, (dict, str)):
       select_info = [select_info]
     for column_info in select_info:
       if isinstance(column_info, str) and column_info == "*":
         self._copy_columns_from_all_sources()
-      elif check_single_table_star_syntax(column_info):
+      elif _check_single_table_star_syntax(column_info):
         source_name = column_info["value"][:-2]
         self._copy_columns_from_source(source_name)
       else:
@@ -230,17 +282,18 @@ class ColumnContainer(Container):
         table's union.
     """
     self._label = union_type
-    column_names = set()
+    column_names: Dict[str, None] = {}
     for table_info in union_info:
       virtual_table = self.table.namespace.create_select_table(
         name=None,
         table_info=table_info
       )
       self.table.add_source(virtual_table)
-      column_names = column_names.union({c.name for c in virtual_table.columns})
+      column_names.update(dict.fromkeys(c.name for c in virtual_table.columns))
+    source_tables = self.table.get_sources()
     for column_name in sorted(column_names):
       column = TableColumn(name=column_name, value=None, table=self.table)
-      for source_table in self.table.get_sources():
+      for source_table in source_tables:
         try:
           column.add_source(source_table.columns[column_name])
         except ColumnLookupError:
@@ -252,15 +305,21 @@ class ColumnContainer(Container):
   def get_all_references(self) -> Set[TTableColumn]:
     """Override of get_all_references to include star column."""
     references = super(ColumnContainer, self).get_all_references()
-    references |= set(self.star_column.get_references())
+    if self._star_column is not None:
+      references.update(self._star_column.get_references())
     return references
 
+  def __len__(self) -> int:
+    """Override of __len__ that counts children without building a list."""
+    if self.star_column_initialized:
+      return len(self._column_list) + 1
+    return len(self._column_list)
+
   def _get_children(self) -> List[TTableColumn]:
     """Overwrite of the _get_children method."""
-    children = [self._column_dict[t] for t in self._column_order_list]
-    if self.star_column.initialized:
-      children.insert(0, self.star_column)
-    return children
+    if self.star_column_initialized:
+      return [self._star_column] + self._column_list
+    return self._column_list[:]
 
   def _get_serializing_id(self) -> str:
     """Overwrite of _get_serializing_id method."""
@@ -13,7 +13,10 @@
 # limitations under the License.
 
 """Info columns that have column-like source tracking functional."""
+from typing import List
+
 from sql_graph.parsing.columns import Column
+from sql_graph.typing import TInfoColumn
 from sql_graph.typing import TTable
 from sql_graph.typing import TokenizedJson
 
@@ -30,6 +33,8 @@ class InfoColumn(Column):
       Will be returned by needs_serializing property.
   """
 
+  __slots__ = ("_needs_serializing",)
+
   def __init__(self, table: TTable, name: str):
     super(InfoColumn, self).__init__(name=name, table=table)
     self._needs_serializing = False
@@ -47,10 +52,35 @@ class InfoColumn(Column):
     """Overwrite of needs_serializing."""
     return self._needs_serializing
 
+  def _get_non_physical_source_tables(self) -> List[TTable]:
+    """Returns unique non-physical tables of the sources, in order.
+
+    Several sources often come from the same table, so each table is
+    checked and returned once.
+    """
+    source_tables = dict.fromkeys(source.table for source in self._sources)
+    return [table for table in source_tables if not table.physical]
+
+  def _add_sources_from_infos(self, info_columns: List[TInfoColumn]) -> None:
+    """Adds sources of other info columns and marks instance for serializing.
+
+    Sources are deduplicated once and added in a single batch.
+
+    Args:
+      info_columns (List[InfoColumn]): info columns to take sources from.
+    """
+    sources = dict.fromkeys(source for info_column in info_columns
+                            for source in info_column.get_sources())
+    if sources:
+      self.add_sources(sources)
+      self._needs_serializing = True
+
 
 class JoinInfo(InfoColumn):
   """Subclass of InfoColumn for representing JOIN"""
 
+  __slots__ = ("_join_infos",)
+
   def __init__(self, table) -> None:
     super(JoinInfo, self).__init__(name="JOIN", table=table)
     self._join_infos = []
@@ -82,18 +112,17 @@ class JoinInfo(InfoColumn):
 
     Method adds sources from the JOIN infos of own sources.
     """
-    source_join_infos = [s.table.join_info for s in self.get_sources()
-                         if not s.table.physical]
+    source_join_infos = [t.join_info
+                         for t in self._get_non_physical_source_tables()]
     super(JoinInfo, self).relink_to_physical_ancestors()
-    for join_info in source_join_infos:
-      for source in join_info.get_sources():
-        self.add_source(source)
-        self._needs_serializing = True
+    self._add_sources_from_infos(source_join_infos)
 
 
 class WhereInfo(InfoColumn):
   """Subclass of InfoColumn for representing WHERE."""
 
+  __slots__ = ()
+
   def __init__(self, table) -> None:
     super(WhereInfo, self).__init__(name="WHERE", table=table)
 
@@ -111,10 +140,7 @@ class WhereInfo(InfoColumn):
 
     Method adds sources from the WHERE infos of own sources.
     """
-    source_where_infos = [s.table.where_info for s in self.get_sources()
-                          if not s.table.physical]
+    source_where_infos = [t.where_info
+                          for t in self._get_non_physical_source_tables()]
     super(WhereInfo, self).relink_to_physical_ancestors()
-    for where_info in source_where_infos:
-      for source in where_info.get_sources():
-        self.add_source(source)
-        self._needs_serializing = True
+    self._add_sources_from_infos(source_where_infos)
@@ -29,6 +29,8 @@ class StarColumn(TableColumn):
       ColumnContainer. Will determine the needs_serializing property.
   """
 
+  __slots__ = ("initialized",)
+
   def add_source(self, source: TColumn) -> None:
     """Override of add_source. Keeps track of the initialization status."""
     super(StarColumn, self).add_source(source)
@@ -37,7 +39,7 @@ class StarColumn(TableColumn):
   def remove_source(self, source: TColumn) -> None:
     """Override of remove_source. Keeps track of the initialization status."""
     super(StarColumn, self).remove_source(source)
-    self.initialized = len(self._sources) != 0
+    self.initialized = bool(self._sources)
 
   def _parse(self) -> None:
     """Overwrite of parsing method to disable parsing."""
@@ -28,6 +28,8 @@ class TableColumn(Column):
     value (TokenizedJson): value of the column.
   """
 
+  __slots__ = ("value",)
+
   def _parse(self) -> None:
     """Override of _parse method."""
     self._parse_value_json(self.value)
@@ -50,21 +52,26 @@ class TableColumn(Column):
     """Copy column for another table.
 
     Replaces the table attribute and adds self as the source. This method is
-    used in case of * syntax.
+    used in case of * syntax. The new value is the qualified name of this
+    column, so instead of parsing it, the source is linked directly and the
+    name is kept for recalculation.
 
     Args:
       new_table (Table): new table that will contain new column object.
-      skip_parsing (bool): whether the parsing should be skipped.
+      skip_parsing (bool): whether linking to this column should be skipped.
 
     Returns:
       Column: new column.
     """
     if not skip_parsing:
-      # new value will be parsed by new column, which will add this column
-      # as a source
       new_value = f"{self.table.name}.{self.name}"
-      c = TableColumn(name=self.name, value=new_value, table=new_table)
+      c = TableColumn(name=self.name, value=new_value, table=new_table,
+                      skip_parsing=True)
+      # same result as parsing new value, which would look this column up
+      c._potential_source_names[new_value] = None
+      c.add_source(self)
+      c._sources_added_by_name[self] = None
     else:
       c = TableColumn(name=self.name, value=None, table=new_table,
-                      skip_parsing=TColumn)
+                      skip_parsing=True)
     return c
@@ -23,14 +23,16 @@ g.remove_non_physical_tables()  # optional
 g.break_cycles()
 g.calculate_table_serializing_params()
 """
-from typing import List, Optional
-from typing import Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from sql_graph.exceptions import ParsingError
 from sql_graph.exceptions import ParsingLookupError
 from sql_graph.parsing.utils import GraphNamespace
 from sql_graph.parsing.utils import TokenizedQuery
+from sql_graph.parsing.utils.misc_utils import find_cyclic_components
 
+from sql_graph.typing import JsonDict
 from sql_graph.typing import TQuery
 from sql_graph.typing import TTable
 
@@ -38,61 +40,103 @@ from sql_graph.typing import TTable
 class Graph:
   """Class representing a SQL graph.
 
+  Class Attributes:
+    UNSUPPORTED_WRITE_MODES (FrozenSet[str]): job write modes of queries that
+      are skipped during parsing.
+
   Attributes:
     _queries (List[Query]): a list of queries added to the graph.
     namespace (GraphNamespace): global namespace with physical tables.
     _anonymous_table_name_counter (int): counter of anonymous tables. Used for
       giving them placeholder names.
+    _max_workers (int or None): number of processes used to tokenize queries.
+      If None, queries are tokenized sequentially.
+    _all_tables_cache (List[Table] or None): all tables of the graph,
+      including tables from nested namespaces. Is reset to None whenever a
+      table is added to or removed from any namespace.
   """
 
+  UNSUPPORTED_WRITE_MODES = frozenset({"UPDATE", "DELETE"})
+
+  def _tokenize_queries(self, queries: List[TQuery]) -> List[List[JsonDict]]:
+    """Init sub-method that tokenizes raw queries.
+
+    Tokenizing does not depend on the graph or on other queries, so if
+    max_workers is set, all queries are tokenized in separate processes at
+    once. Queries are sent to the workers in chunks to reduce the overhead of
+    inter-process communication.
+
+    Args:
+      queries (List[Query]): queries to tokenize.
+    Returns:
+      List[List[JsonDict]]: tokenized steps of each query.
+    """
+    if self._max_workers is None or len(queries) < 2:
+      return [TokenizedQuery.tokenize(query) for query in queries]
+    with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+      chunksize = max(1, len(queries) // (self._max_workers * 4))
+      return list(executor.map(TokenizedQuery.tokenize, queries,
+                               chunksize=chunksize))
+
   def _parse_queries(self):
     """Init sub-method that tokenizes and parses all queries."""
+    queries = []
     for query in self._queries:
-      if query.job_write_mode in ("UPDATE", "DELETE"):
+      if query.job_write_mode in self.UNSUPPORTED_WRITE_MODES:
         # TODO: update and delete are ignored as they are not supported
         print(f"Skipping {query}: Unsupported write mode")
         continue
-      tokenized_query = TokenizedQuery(query, graph=self)
-      for tokenized_step in tokenized_query.get_tokenized_steps():
-        try:
-          self.namespace.create_physical_table(
-            name=tokenized_step.table_name,
-            table_info=tokenized_step.query,
-            query=tokenized_query,
-          )
-        except ParsingError as e:
-          print(f"Failed to parse {tokenized_query} due to an error: {e}")
+      queries.append(query)
+    tokenized_queries = [
+      TokenizedQuery(query, graph=self, tokenized_steps=tokenized_steps)
+      for query, tokenized_steps in zip(queries,
+                                        self._tokenize_queries(queries))
+    ]
+    # flatten all steps first, so that tables are created in a single loop
+    steps = [(tokenized_step.table_name, tokenized_step.query, tokenized_query)
+             for tokenized_query in tokenized_queries
+             for tokenized_step in tokenized_query.get_tokenized_steps()]
+    for table_name, table_info, tokenized_query in steps:
+      try:
+        self.namespace.create_physical_table(
+          name=table_name,
+          table_info=table_info,
+          query=tokenized_query,
+        )
+      except ParsingError as e:
+        print(f"Failed to parse {tokenized_query} due to an error: {e}")
 
   def _add_descriptions(self):
-    """Init sub-method that adds table and column descriptions."""
-    def _lowercase_keys(d):
-      lowercase_dict = {}
-      for key in d:
-        lowercase_dict[key.lower()] = d[key]
-      return lowercase_dict
+    """Init sub-method that adds table and column descriptions.
 
+    Column names are matched to the description keys case-insensitively.
+    """
     for query in self._queries:
       if query.descriptions is not None:
         query_table_desc = query.descriptions.get("table")
-        query_columns_desc = _lowercase_keys(
-          d=query.descriptions.get("columns", {}))
+        query_columns_desc = {
+          key.lower(): value
+          for key, value in query.descriptions.get("columns", {}).items()
+        }
         try:
           query_table = self.namespace.get_table_by_name(query.target_table)
           if query_table_desc is not None:
             query_table.add_data("description", query_table_desc)
           for column in query_table.columns:
-            if column.name in query_columns_desc:
-              column_desc = query_columns_desc[column.name]
-              if column_desc is not None:
-                column.add_data("description", column_desc)
+            column_desc = query_columns_desc.get(column.name.lower())
+            if column_desc is not None:
+              column.add_data("description", column_desc)
         except ParsingLookupError as e:
           print(f"An error {e} has occurred while adding descriptions for "
                 f"{query}: skipping")
 
-  def __init__(self, queries: List[TQuery]) -> None:
+  def __init__(self, queries: List[TQuery],
+               max_workers: Optional[int] = None) -> None:
     self._queries = queries
+    self._max_workers = max_workers
     self.namespace = GraphNamespace(self)
     self._anonymous_table_name_counter = 0
+    self._all_tables_cache: Optional[List[TTable]] = None
 
     self._parse_queries()
     self._add_descriptions()
@@ -103,53 +147,143 @@ class Graph:
     self._anonymous_table_name_counter += 1
     return name
 
+  def get_all_tables(self) -> List[TTable]:
+    """Returns a list of all tables, including tables of nested namespaces.
+
+    The list is computed once and reused until any namespace changes.
+    """
+    if self._all_tables_cache is None:
+      self._all_tables_cache = self.namespace.get_tables(recursive=True)
+    return self._all_tables_cache[:]
+
+  def invalidate_all_tables_cache(self) -> None:
+    """Clears the cached list of all tables."""
+    self._all_tables_cache = None
+
   def remove_non_physical_tables(self) -> None:
     """Starts relinking process and clears namespaces of physical tables."""
+    # relinking only reads the namespace of the table itself, so it can be
+    # cleared right away
     for table in self.namespace.get_tables(recursive=False):
       table.relink_to_physical_ancestors()
-    for table in self.namespace.get_tables(recursive=False):
       table.namespace.clear()
 
-  def _find_cycles_relative_to_table(self, starting_table: TTable,
-                                     table: Optional[TTable] = None,
-                                     visited: Optional[Set[TTable]] = None):
-    """Helper method that finds cycles using DFS.
+  @staticmethod
+  def _get_cached_sources(
+      table: TTable,
+      sources_cache: Dict[TTable, Tuple[TTable, ...]]) -> Tuple[TTable, ...]:
+    """Returns source tables of a table, computing them once.
+
+    Args:
+      table (Table): table to get the sources of.
+      sources_cache (Dict[TTable, Tuple[TTable, ...]]): cache of table
+        sources, which is filled on the first access.
+    Returns:
+      Tuple[TTable, ...]: source tables.
+    """
+    try:
+      return sources_cache[table]
+    except KeyError:
+      sources = sources_cache[table] = tuple(table.get_all_sources())
+      return sources
+
+  def _find_cyclic_components(
+      self, tables: List[TTable],
+      sources_cache: Dict[TTable, Tuple[TTable, ...]]) -> Dict[TTable, int]:
+    """Finds strongly connected components of tables that contain cycles.
+
+    Tables are numbered and their sources are converted to integer adjacency
+    lists, which are then searched by find_cyclic_components. Tables outside
+    of the returned components cannot be part of a cycle.
+
+    Args:
+      tables (List[Table]): tables to start the search from.
+      sources_cache (Dict[TTable, Tuple[TTable, ...]]): cache of table
+        sources.
+    Returns:
+      Dict[TTable, int]: component ID of every table that is part of a
+        cycle, including tables that are their own source.
+    """
+    tables = list(tables)
+    positions = {table: i for i, table in enumerate(tables)}
+    adjacency: List[List[int]] = []
+    # sources that are missing from the list are appended to it
+    while len(adjacency) < len(tables):
+      source_positions = []
+      for source_table in self._get_cached_sources(tables[len(adjacency)],
+                                                   sources_cache):
+        if source_table not in positions:
+          positions[source_table] = len(tables)
+          tables.append(source_table)
+        source_positions.append(positions[source_table])
+      adjacency.append(source_positions)
+
+    component_ids = find_cyclic_components(adjacency)
+    components: Dict[TTable, int] = {}
+    for table, component_id in zip(tables, component_ids):
+      if component_id != -1:
+        components[table] = component_id
+    return components
+
+  def _find_cycles_relative_to_table(
+      self, starting_table: TTable, components: Dict[TTable, int],
+      sources_cache: Dict[TTable, Tuple[TTable, ...]]):
+    """Helper method that finds cycles using an iterative DFS.
+
+    The search does not leave the strongly connected component of the
+    starting table, since no cycle through it can pass outside of it.
+    Sources are read when a table is first reached, so cycles broken while
+    the search is running are taken into account for tables visited later,
+    as long as the caller refreshes the cache of the relinked tables.
 
     Args:
       starting_table (Table): initial table. If it will be encountered again
         over the course of DFS, then a cycle is found.
-      table (Table or None): current table.
-      visited (Set[TTable]): set with tables that were already visited.
+      components (Dict[TTable, int]): component IDs of cyclic tables.
+      sources_cache (Dict[TTable, Tuple[TTable, ...]]): cache of table
+        sources.
     Yields:
       Pairs of tables which complete the cycle. One of them is always going to
         be starting table.
     """
-    if table is None:
-      table = starting_table
-      visited = set()
-    visited.add(table)
-    for source_table in table.get_all_sources():
-      if source_table == starting_table:
-        yield starting_table, table
-      if source_table not in visited:
-        yield from self._find_cycles_relative_to_table(
-          starting_table,
-          source_table,
-          visited
-        )
+    component_id = components[starting_table]
+    visited = {starting_table}
+    stack = [(starting_table,
+              iter(self._get_cached_sources(starting_table, sources_cache)))]
+    while stack:
+      table, sources = stack[-1]
+      for source_table in sources:
+        if source_table is starting_table:
+          yield starting_table, table
+        if (source_table not in visited
+            and components.get(source_table) == component_id):
+          visited.add(source_table)
+          stack.append(
+            (source_table,
+             iter(self._get_cached_sources(source_table, sources_cache))))
+          break
+      else:
+        stack.pop()
 
   def break_cycles(self) -> None:
     """Finds cycles and creates Cycle Breaker tables to break them.
 
     If requested, will remove Cycle Breakers that are self-references.
+    Only tables that belong to a cycle are searched.
     """
-    sorted_tables = sorted(self.namespace.get_tables(recursive=True),
-                           key=lambda x: x.name)
+    sorted_tables = sorted(self.get_all_tables(), key=lambda x: x.name)
+    sources_cache = {}
+    components = self._find_cyclic_components(sorted_tables, sources_cache)
     for table in sorted_tables:
-      for source, target in self._find_cycles_relative_to_table(table):
+      if table not in components:
+        continue
+      for source, target in self._find_cycles_relative_to_table(
+          table, components, sources_cache):
         self.namespace.create_cycle_breaker_table(source, target)
+        # only the target table is relinked to the cycle breaker
+        sources_cache[target] = tuple(target.get_all_sources())
 
   def calculate_table_serializing_params(self) -> None:
     """Calculates serializing params of tables in the correct order."""
-    for table in self.namespace.get_tables(recursive=True):
+    for table in self.get_all_tables():
       table.calculate_serializing_params()
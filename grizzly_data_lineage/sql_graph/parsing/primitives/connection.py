@@ -25,6 +25,8 @@ class Connection:
     data (JsonDict): any other connection data. Will be used by ReactFlow.
   """
 
+  __slots__ = ("source", "target", "data")
+
   def __init__(self, source: TGridItem, target: TGridItem) -> None:
     self.source = source
     self.target = target
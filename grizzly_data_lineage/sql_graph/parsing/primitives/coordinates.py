@@ -13,13 +13,11 @@
 # limitations under the License.
 
 """Coordinates class."""
-import functools
 from typing import Tuple
 
 from sql_graph.typing import TCoordinates
 
 
-@functools.total_ordering  # to support sorting
 class Coordinates:
   """2D coordinates.
 
@@ -29,6 +27,8 @@ class Coordinates:
     initialized (bool): whether coordinates were initialized.
   """
 
+  __slots__ = ("x", "y", "initialized")
+
   def __init__(self, x: int = 0, y: int = 0, initialized: bool = True) -> None:
     self.x = x
     self.y = y
@@ -38,11 +38,22 @@ class Coordinates:
     """Enables == operator to work with this class."""
     return self.x == other.x and self.y == other.y
 
+  # comparison operators are defined explicitly to support fast sorting
+  def __lt__(self, other: TCoordinates) -> bool:
+    """Enables < operator to work with this class."""
+    return (self.x, self.y) < (other.x, other.y)
+
+  def __le__(self, other: TCoordinates) -> bool:
+    """Enables <= operator to work with this class."""
+    return (self.x, self.y) <= (other.x, other.y)
+
   def __gt__(self, other: TCoordinates) -> bool:
     """Enables > operator to work with this class."""
-    if self.x == other.x:
-      return self.y > other.y
-    return self.x > other.x
+    return (self.x, self.y) > (other.x, other.y)
+
+  def __ge__(self, other: TCoordinates) -> bool:
+    """Enables >= operator to work with this class."""
+    return (self.x, self.y) >= (other.x, other.y)
 
   def __repr__(self) -> str:
     """Representation of the class in print for debug purposes."""
@@ -14,8 +14,11 @@
 
 import abc
 from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from sql_graph.exceptions import ParsingError
 from sql_graph.exceptions import SerializingParamsNotReady
@@ -50,21 +53,24 @@ class GridItem(abc.ABC):
       displayed, such as table drag handle.
 
   Attributes:
-    _sources (List[TGridItem]): list of the sources of the instance.
-    _references (List[TGridItem]): list of the references, i.e. objects that
-      have the instance as a source.
+    _sources (Dict[TGridItem, None]): sources of the instance, stored as keys
+      of an insertion-ordered dict for constant time membership and removal.
+    _references (Dict[TGridItem, None]): references, i.e. objects that
+      have the instance as a source. Stored the same way as sources.
     _serializing_params (SerializingParams): object with params used for
       serialization and visualization. Is protected to prevent outside
       modification.
   """
 
+  __slots__ = ("_sources", "_references", "_serializing_params")
+
   WIDTH = 0
   VERTICAL_MARGIN = 0
   MAX_WIDTH_PENALTY = 0
 
   def __init__(self) -> None:
-    self._sources: List[TGridItem] = []
-    self._references: List[TGridItem] = []
+    self._sources: Dict[TGridItem, None] = {}
+    self._references: Dict[TGridItem, None] = {}
     self._serializing_params = SerializingParams(self)
 
   # SOURCE MANAGEMENT
@@ -73,8 +79,7 @@ class GridItem(abc.ABC):
 
     This method should only be called inside add_source.
     """
-    if reference not in self._references:
-      self._references.append(reference)
+    self._references.setdefault(reference, None)
 
   def add_source(self, source: TGridItem) -> None:
     """Adds a source to the list.
@@ -82,9 +87,17 @@ class GridItem(abc.ABC):
     Also calls register_reference of the source.
     """
     if source not in self._sources:
-      self._sources.append(source)
+      self._sources[source] = None
       source.register_reference(self)
 
+  def add_sources(self, sources: Iterable[TGridItem]) -> None:
+    """Adds several sources to the list, in order.
+
+    Calls add_source for each of them, so overrides of add_source still apply.
+    """
+    for source in sources:
+      self.add_source(source)
+
   def drop_reference(self, reference: TGridItem) -> None:
     """Removes a reference from the list.
 
@@ -92,8 +105,8 @@ class GridItem(abc.ABC):
     Reference must be present in the list or an error will occur.
     """
     try:
-      self._references.remove(reference)
-    except ValueError as e:
+      del self._references[reference]
+    except KeyError as e:
       raise ParsingError(f"Attempted to remove reference {reference}, which "
                          f"was never added as a reference") from e
 
@@ -104,31 +117,41 @@ class GridItem(abc.ABC):
     Also calls drop_reference of the source.
     """
     try:
-      self._sources.remove(source)
-      source.drop_reference(self)
-    except ValueError as e:
+      del self._sources[source]
+    except KeyError as e:
       raise ParsingError(f"Attempted to remove source {source}, which was "
                          f"never added as a source") from e
+    source.drop_reference(self)
 
   def replace_sources(self, new_sources: List[TGridItem]) -> None:
-    for source in self._sources[:]:
+    for source in list(self._sources):
       self.remove_source(source)
     for source in new_sources:
       self.add_source(source)
 
-  def get_sources(self) -> List[TGridItem]:
-    """Returns a list of all sources of the instance.
+  def get_sources(self) -> Tuple[TGridItem, ...]:
+    """Returns a tuple of all sources of the instance.
 
-    Child objects (if any) are not considered for this method.
+    Child objects (if any) are not considered for this method. The tuple is a
+    snapshot, so sources can be removed while iterating over it.
     """
-    return self._sources[:]
+    return tuple(self._sources)
+
+  def has_source(self, source: TGridItem) -> bool:
+    """Checks in constant time if an object is a direct source of instance."""
+    return source in self._sources
 
-  def get_references(self):
-    """Returns a list of all references of the instance.
+  def has_sources(self) -> bool:
+    """Checks if instance has any direct sources, without copying them."""
+    return bool(self._sources)
 
-    Child objects (if any) are not considered for this method.
+  def get_references(self) -> Tuple[TGridItem, ...]:
+    """Returns a tuple of all references of the instance.
+
+    Child objects (if any) are not considered for this method. The tuple is a
+    snapshot, so references can be removed while iterating over it.
     """
-    return self._references[:]
+    return tuple(self._references)
 
   def relink_to_physical_ancestors(self) -> None:
     """Will recalculate instance's sources to make them physical."""
@@ -161,30 +184,31 @@ class GridItem(abc.ABC):
     Returns:
       int: height of the new label in pixels.
     """
-    if self._serializing_params.width != 0:
+    params = self._serializing_params
+    if params.width != 0:
       # this method might be called several times
       # but the wrapping should only be performed after width was calculated
       wrapped_label, text_height = wrap_text(
-        text=self._serializing_params.label,
-        text_width=self._serializing_params.width - self.MAX_WIDTH_PENALTY,
+        text=params.label,
+        text_width=params.width - self.MAX_WIDTH_PENALTY,
         letter_width=LABEL_LETTER_WIDTH,
         line_height=LABEL_LINE_HEIGHT
       )
-      self._serializing_params.label = wrapped_label
-      if "description" in self._serializing_params.data:
+      params.label = wrapped_label
+      if "description" in params.data:
         # add space to display description
-        self._serializing_params.data["description"] = \
-          self._serializing_params.data["description"].replace("\n", " ")
+        params.data["description"] = params.data["description"].replace(
+          "\n", " ")
         wrapped_desc, desc_height = wrap_text(
-          text=self._serializing_params.data["description"],
-          text_width=self._serializing_params.width,
+          text=params.data["description"],
+          text_width=params.width,
           letter_width=DESC_LETTER_WIDTH,
           line_height=DESC_LINE_HEIGHT,
           max_lines=MAX_DESC_LINES
         )
         if self.MAX_WIDTH_PENALTY > 0:
           text_height += DESC_LINE_HEIGHT
-        self._serializing_params.data["truncated_description"] = wrapped_desc
+        params.data["truncated_description"] = wrapped_desc
         text_height += desc_height
       return text_height
     else:
@@ -197,12 +221,13 @@ class GridItem(abc.ABC):
     in a specific way. ID will always be calculated first because it might be
     used by child objects to calculate their ID.
     """
-    self._serializing_params.id = self._get_serializing_id()
-    self._serializing_params.label = self._get_label()
-    self._serializing_params.width = self.WIDTH
+    params = self._serializing_params
+    params.id = self._get_serializing_id()
+    params.label = self._get_label()
+    params.width = self.WIDTH
     label_height = self._wrap_label()
-    self._serializing_params.height = 2 * self.VERTICAL_MARGIN + label_height
-    self._serializing_params.ready = True
+    params.height = 2 * self.VERTICAL_MARGIN + label_height
+    params.ready = True
 
   def calculate_serializing_params(self,
                                    parent: Optional[TContainer] = None) -> None:
@@ -260,9 +285,24 @@ class GridItem(abc.ABC):
     Args:
       source (GridItem): source GridItem object
     """
-    self._serializing_params.connections.append(Connection(source, self))
+    self.add_connections([source])
+
+  def add_connections(self, sources: Iterable[TGridItem]) -> None:
+    """Adds new connections from several sources to the connections list.
+
+    Args:
+      sources (Iterable[GridItem]): source GridItem objects.
+    """
+    connections = [Connection(source, self) for source in sources]
+    if not connections:
+      return
+    if self._serializing_params.connections:
+      self._serializing_params.connections.extend(connections)
+    else:
+      self._serializing_params.connections = connections
     self._serializing_params.has_inbound_connection = True
-    source.acknowledge_outbound_connection()
+    for connection in connections:
+      connection.source.acknowledge_outbound_connection()
 
   def acknowledge_outbound_connection(self):
     """Method that sets has_outbound_connection to True.
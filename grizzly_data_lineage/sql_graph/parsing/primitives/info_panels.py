@@ -26,6 +26,8 @@ class TextInfoPanel(GridItem):
     text (str): text label that will be displayed.
   """
 
+  __slots__ = ("name", "text")
+
   WIDTH = COLUMN_WIDTH
   VERTICAL_MARGIN = COLUMN_VERTICAL_MARGIN
 
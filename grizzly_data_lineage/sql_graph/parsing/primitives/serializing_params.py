@@ -13,7 +13,7 @@
 # limitations under the License.
 
 """Serializing params class."""
-from typing import List
+from typing import Sequence
 from typing import Optional
 
 from sql_graph.parsing.primitives import Coordinates
@@ -36,12 +36,18 @@ class SerializingParams:
     height (int): visualization height of the parent object.
     label (str): text label used for visualization.
     data (JsonDict): any other object data. Will be used by ReactFlow.
-    connections (List[Connection]): list of the owner object connections.
+    connections (Sequence[Connection]): owner object connections. Is an
+      empty tuple until the first connection is added, so that objects without
+      connections do not allocate a list.
     has_inbound_connection (bool): whether the object has an inbound connection.
     has_outbound_connection (bool): whether the object has an outbound
       connection.
   """
 
+  __slots__ = ("ready", "id", "python_type", "parent", "query", "coordinates",
+               "width", "height", "label", "data", "connections",
+               "has_inbound_connection", "has_outbound_connection")
+
   def __init__(self, owner: TGridItem):
     self.ready = False
 
@@ -56,7 +62,7 @@ class SerializingParams:
     self.label = None
     self.data = {}
 
-    self.connections: List[TConnection] = []
+    self.connections: Sequence[TConnection] = ()
     self.has_inbound_connection = False
     self.has_outbound_connection = False
 
@@ -13,12 +13,14 @@
 # limitations under the License.
 
 """Cycle breaker table."""
-from typing import Set
+from typing import FrozenSet
 
 from sql_graph.parsing.tables import Table
 from sql_graph.typing import TTable
 from sql_graph.typing import TableLocation
 
+_NO_SOURCES: FrozenSet[TTable] = frozenset()
+
 
 class CycleBreakerTable(Table):
   """Special table class used to break cycles in the graph.
@@ -34,11 +36,12 @@ class CycleBreakerTable(Table):
     """Relinks references of target table to the CycleBreaker instance."""
     self.target_table.remove_source(self.source_table)
     self.target_table.add_source(self)
-    for reference in self.source_table.get_all_references():
-      from sql_graph.parsing.columns import Column
-      if isinstance(reference, Column) and reference.table == self.target_table:
-        reference.replace_sources_from_table(old_table=self.source_table,
-                                             new_table=self)
+    # only columns of the target table are relinked, so they are visited
+    # directly instead of scanning all references of the source table
+    target = self.target_table
+    for column in [*target.columns, target.join_info, target.where_info]:
+      column.replace_sources_from_table(old_table=self.source_table,
+                                        new_table=self)
 
   def _parse(self) -> None:
     """Override of the parsing method to set up the CycleBreaker table.
@@ -47,10 +50,8 @@ class CycleBreakerTable(Table):
     target table.
     """
     for column in self.source_table.columns:
-      column_copy = column.copy(new_table=self, skip_parsing=True)
-      for source in column_copy.get_sources():
-        column_copy.remove_source(source)
-      self.columns.add_column(column_copy)
+      # copies made without parsing have no sources
+      self.columns.add_column(column.copy(new_table=self, skip_parsing=True))
     self._relink_references()
 
   def __init__(self, source: TTable, target: TTable,
@@ -69,12 +70,13 @@ class CycleBreakerTable(Table):
     return f"<Cycle Breaker Table source={self.source_table} " \
            f"target={self.target_table}>"
 
-  def get_all_sources(self) -> Set[TTable]:
+  def get_all_sources(self) -> FrozenSet[TTable]:
     """Override of get_all_sources to return an empty set.
 
-    CycleBreaker by design has no sources.
+    CycleBreaker by design has no sources, so a shared empty frozenset is
+    returned.
     """
-    return set()
+    return _NO_SOURCES
 
   def _get_label(self) -> str:
     """Override of the _get_label method to indicate that this is a copy."""
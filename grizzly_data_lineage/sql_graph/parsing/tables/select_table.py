@@ -50,10 +50,10 @@ class SelectTable(Table):
   @staticmethod
   def _check_for_virtual_table(source_info: TokenizedJson) -> bool:
     """Checks if a virtual table is present in a tokenized JSON"""
-    virtual_table_tags = ["select", "select_distinct", "union", "union_all",
-                          "unnest"]
+    virtual_table_tags = {"select", "select_distinct", "union", "union_all",
+                          "unnest"}
     if isinstance(source_info, dict):
-      return any([t in virtual_table_tags for t in source_info])
+      return not virtual_table_tags.isdisjoint(source_info)
     else:
       return False
 
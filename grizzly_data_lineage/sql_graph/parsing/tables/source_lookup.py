@@ -36,7 +36,7 @@ def lookup_source_table_with_star_column(table: TTable) -> str:
      str: table name
   """
   sources_with_star_column = [t for t in table.get_sources()
-                              if t.columns.star_column.initialized]
+                              if t.columns.star_column_initialized]
   if len(sources_with_star_column) == 1:
     return sources_with_star_column[0].name
   elif len(sources_with_star_column) > 1:
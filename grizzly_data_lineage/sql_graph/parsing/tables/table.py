@@ -14,6 +14,7 @@
 
 """Abstract table class."""
 import abc
+import sys
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -85,12 +86,13 @@ class Table(Container, abc.ABC):
     """Returns name for the table based on the passed name.
 
     If the name is None, will get next available anonymous name from the graph.
+    Names are interned, since they are used as keys in namespaces and lookups.
     """
     if name is not None:
       name = name.replace("..", ".")
     else:
       name = self.query.graph.get_next_anonymous_name()
-    return name
+    return sys.intern(name)
 
   def __init__(self, name: Optional[str], table_info: TokenizedJson,
                location: TableLocation, query: TTokenizedQuery) -> None:
@@ -136,12 +138,19 @@ class Table(Container, abc.ABC):
         result.add(reference)
     return result
 
+  def add_source(self, source: TGridItem) -> None:
+    """Override of add_source that invalidates source lookup cache."""
+    self.namespace.invalidate_source_lookup_cache()
+    super(Table, self).add_source(source)
+
   def remove_source(self, source: TGridItem) -> None:
     """Override of remove_source to control for a special case.
 
     If a source, which is requested to be removed, it not a direct source, but
     a source from one of the table columns, the ParsingError will not be raised.
+    Also invalidates source lookup cache.
     """
+    self.namespace.invalidate_source_lookup_cache()
     try:
       super(Table, self).remove_source(source)
     except ParsingError as e:
@@ -170,7 +179,7 @@ class Table(Container, abc.ABC):
       if isinstance(reference, Table):
         reference.refresh_source(self)
         star_column = self.columns.star_column
-        if star_column in reference.columns.star_column.get_sources():
+        if reference.columns.star_column.has_source(star_column):
           columns_added = reference.columns.redo_copy(source_to_redo=self)
           if columns_added:
             tables_to_recalculate.append(reference)
@@ -198,7 +207,7 @@ class Table(Container, abc.ABC):
         physical_sources.extend(source.relink_to_physical_ancestors())
     self.replace_sources(physical_sources)
     super(Table, self).relink_to_physical_ancestors()
-    return [self] if self.physical else self.get_sources()
+    return [self] if self.physical else list(self._sources)
 
   def _get_children(self) -> List[TGridItem]:
     """Override of the _get_children method to include info panels."""
@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from textwrap import wrap
+import functools
+from textwrap import TextWrapper
+from typing import List
 from typing import Tuple
 
 
+@functools.lru_cache(maxsize=None)
+def _get_text_wrapper(width: int) -> TextWrapper:
+  """Returns a shared TextWrapper for the given width."""
+  return TextWrapper(width=width)
+
+
 def wrap_text(
     text: str,
     text_width: int,
@@ -24,7 +32,12 @@ def wrap_text(
     max_lines: int = 0,
   ) -> Tuple[str, int]:
   letters_per_line = int(text_width // letter_width)
-  lines = wrap(text, width=letters_per_line)
+  if (0 < len(text) <= letters_per_line and text.isprintable()
+      and text[0] != " " and text[-1] != " "):
+    # text fits on one line and wrapping would not change it
+    lines = [text]
+  else:
+    lines = _get_text_wrapper(letters_per_line).wrap(text)
   n_lines = len(lines)
   if max_lines > 0:
     if n_lines > max_lines:
@@ -33,3 +46,69 @@ def wrap_text(
   wrapped_text = "\n".join(lines[:n_lines])
   text_height = int(n_lines * line_height)
   return wrapped_text, text_height
+
+
+def find_cyclic_components(adjacency: List[List[int]]) -> List[int]:
+  """Finds strongly connected components of a graph that contain cycles.
+
+  Uses an iterative version of Tarjan's algorithm, so deep graphs do not hit
+  the recursion limit.
+
+  Args:
+    adjacency (List[List[int]]): for every node, the list of nodes it has
+      edges to. Nodes are numbered from 0 to len(adjacency) - 1.
+  Returns:
+    List[int]: component ID of every node, or -1 if the node is not part of
+      a cycle. Nodes with an edge to themselves are part of a cycle.
+  """
+  node_count = len(adjacency)
+  index = [-1] * node_count
+  lowlink = [0] * node_count
+  on_stack = [False] * node_count
+  self_referencing = [False] * node_count
+  scc_stack: List[int] = []
+  components = [-1] * node_count
+  component_id = 0
+  next_index = 0
+  work = []
+
+  for root in range(node_count):
+    if index[root] != -1:
+      continue
+    index[root] = lowlink[root] = next_index
+    next_index += 1
+    scc_stack.append(root)
+    on_stack[root] = True
+    work.append((root, iter(adjacency[root])))
+    while work:
+      node, targets = work[-1]
+      for target in targets:
+        if target == node:
+          self_referencing[node] = True
+        if index[target] == -1:
+          index[target] = lowlink[target] = next_index
+          next_index += 1
+          scc_stack.append(target)
+          on_stack[target] = True
+          work.append((target, iter(adjacency[target])))
+          break
+        elif on_stack[target]:
+          lowlink[node] = min(lowlink[node], index[target])
+      else:
+        work.pop()
+        if work:
+          parent = work[-1][0]
+          lowlink[parent] = min(lowlink[parent], lowlink[node])
+        if lowlink[node] == index[node]:
+          component = []
+          while True:
+            member = scc_stack.pop()
+            on_stack[member] = False
+            component.append(member)
+            if member == node:
+              break
+          if len(component) > 1 or self_referencing[node]:
+            for member in component:
+              components[member] = component_id
+            component_id += 1
+  return components
@@ -22,12 +22,17 @@ from typing import Optional
 
 from sql_graph.exceptions import ParsingError
 from sql_graph.exceptions import TableLookupError
+from sql_graph.typing import TColumn
 from sql_graph.typing import TGraph
 from sql_graph.typing import TTable
 from sql_graph.typing import TTokenizedQuery
 from sql_graph.typing import TableLocation
 from sql_graph.typing import TokenizedJson
 
+# lookup_source is bound on first use, since sql_graph.parsing.tables imports
+# this module and a top level import would be circular
+_lookup_source = None
+
 
 class Namespace(abc.ABC):
   """Abstract namespace class.
@@ -75,8 +80,9 @@ class Namespace(abc.ABC):
     TableLookupError.
     """
     name = name.replace("..", ".")
-    if name in self._tables:
-      return self._tables[name]
+    table = self._tables.get(name)
+    if table is not None:
+      return table
     elif hasattr(self._master, "location"):
       return self._master.location.namespace.get_table_by_name(name)
     else:
@@ -135,6 +141,9 @@ class TableNamespace(Namespace):
     query (Query): query of the master table.
     graph (Graph): reference to the graph object. Used to add external tables.
     _aliases (Dict[str, str]): dictionary with aliases.
+    _source_lookup_cache (Dict[str, TColumn]): source columns that were
+      successfully looked up by name. Is cleared whenever sources, aliases or
+      tables of the master table change.
   """
 
   def __init__(self, master: TTable) -> None:
@@ -142,6 +151,19 @@ class TableNamespace(Namespace):
     self.query = master.query
     self.graph = master.query.graph
     self._aliases: Dict[str, str] = {}
+    self._source_lookup_cache: Dict[str, TColumn] = {}
+
+  def _add_table(self, table: TTable) -> None:
+    """Override of _add_table that invalidates source lookup cache."""
+    self.invalidate_source_lookup_cache()
+    self.graph.invalidate_all_tables_cache()
+    super(TableNamespace, self)._add_table(table)
+
+  def remove_table(self, table_name: str) -> None:
+    """Override of remove_table that invalidates source lookup cache."""
+    self.invalidate_source_lookup_cache()
+    self.graph.invalidate_all_tables_cache()
+    super(TableNamespace, self).remove_table(table_name)
 
   def _create_table_by_class(self, table_cls, **kwargs) -> TTable:
     """Override of _create_table_by_class to set query argument."""
@@ -182,6 +204,7 @@ class TableNamespace(Namespace):
       raise ParsingError(f"Alias with name {alias_name} "
                          f"for {self} already exists.")
     else:
+      self.invalidate_source_lookup_cache()
       self._aliases[alias_name] = table_name
 
   def get_table_by_name(self, name: str) -> TTable:
@@ -189,6 +212,33 @@ class TableNamespace(Namespace):
     name = self._aliases.get(name, name)
     return super(TableNamespace, self).get_table_by_name(name)
 
+  def lookup_source_column(self, source_name: str) -> TColumn:
+    """Looks up a column among the sources of master table by a generic name.
+
+    Found columns are cached until the cache is invalidated. Failed lookups
+    are not cached, since the table may still be added to the namespace of
+    master's location, which does not invalidate this cache.
+
+    Args:
+      source_name (str): source column name, optionally with a table name.
+    Returns:
+      Column: source column.
+    """
+    global _lookup_source
+
+    column = self._source_lookup_cache.get(source_name)
+    if column is None:
+      if _lookup_source is None:
+        from sql_graph.parsing.tables import lookup_source as _lookup_source
+      table_name, column_name = _lookup_source(self._master, source_name)
+      column = self.get_table_by_name(table_name).columns[column_name]
+      self._source_lookup_cache[source_name] = column
+    return column
+
+  def invalidate_source_lookup_cache(self) -> None:
+    """Clears cached source column lookups."""
+    self._source_lookup_cache.clear()
+
 
 class GraphNamespace(Namespace):
   """Implementation of the namespace for a graph."""
@@ -200,8 +250,10 @@ class GraphNamespace(Namespace):
     """Override of the _add_table with special logic for name collision.
 
     If table that is being added collides with an existing external table,
-    triggers recalculation logic and replaces existing table.
+    triggers recalculation logic and replaces existing table. Also invalidates
+    graph's table list cache.
     """
+    self._master.invalidate_all_tables_cache()
     try:
       super(GraphNamespace, self)._add_table(table)
     except ParsingError as e:
@@ -214,6 +266,11 @@ class GraphNamespace(Namespace):
       else:
         raise e
 
+  def remove_table(self, table_name: str) -> None:
+    """Override of remove_table that invalidates graph's table list cache."""
+    self._master.invalidate_all_tables_cache()
+    super(GraphNamespace, self).remove_table(table_name)
+
   def create_physical_table(self, name: str,
                             table_info: TokenizedJson,
                             query: TTokenizedQuery) -> TTable:
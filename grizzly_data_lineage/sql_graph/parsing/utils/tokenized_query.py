@@ -13,7 +13,9 @@
 # limitations under the License.
 
 """Tokenizable Query Module."""
+import functools
 from typing import List
+from typing import Optional
 
 import mo_parsing
 import mo_sql_parsing
@@ -24,6 +26,18 @@ from sql_graph.typing import TGraph
 from sql_graph.typing import TQuery
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_step(step: str) -> JsonDict:
+  """Tokenizes a single step, reusing results for identical steps.
+
+  The cache is local to the process that tokenizes, so with max_workers set
+  it only helps within the chunk of queries handled by one worker. Tokenized
+  steps are only read during parsing, so the same result can be shared.
+  Errors are not cached and will be raised again.
+  """
+  return mo_sql_parsing.parse_bigquery(step)
+
+
 class TokenizedQuery:
   """Class representing a singe query.
 
@@ -132,11 +146,14 @@ class TokenizedQuery:
       query_steps.append(current_step)
     return query_steps
 
-  def _tokenize_query(self, query_steps: List[str]) -> List[JsonDict]:
+  @staticmethod
+  def _tokenize_query(query_steps: List[str],
+                      query_name: str) -> List[JsonDict]:
     """Splits query into single steps and tries to tokenize each of them.
 
     Args:
-      query_steps ():
+      query_steps (List[str]): list of query steps.
+      query_name (str): name of the query used in error logs.
     Returns:
       List[JsonDict]: list of tokenized steps.
     """
@@ -150,14 +167,14 @@ class TokenizedQuery:
     def _trace_tokenizer_error(s, e):
       """Logs the error of tokenizer."""
       step_preview = _get_step_preview(s)
-      print(f"Could not parse step '{step_preview}...' of {str(self)}"
+      print(f"Could not parse step '{step_preview}...' of {query_name}"
             f"\n\tdue to tokenizer error: {e}"
             f"\n\tSkipping step")
 
     def _trace_formatter_error(s, e_t, e_f):
       """Logs errors of both tokenizer and formatter."""
       step_preview = _get_step_preview(s)
-      print(f"Could not parse step '{step_preview}...' of {str(self)}"
+      print(f"Could not parse step '{step_preview}...' of {query_name}"
             f"\n\tdue to tokenizer error: {e_t}"
             f"\n\tand formatter error {e_f}"
             f"\n\tSkipping step")
@@ -167,7 +184,7 @@ class TokenizedQuery:
       try:
         if step:
           # first, attempt to parse step as is
-          tokenized_step = mo_sql_parsing.parse_bigquery(step)
+          tokenized_step = _parse_step(step)
           tokenized_steps.append(tokenized_step)
       except mo_parsing.ParseException as tokenizer_error1:
         try:
@@ -175,7 +192,7 @@ class TokenizedQuery:
           formatted_step = format_sql(step).lower()
           try:
             # if formatting was successful, retry parsing
-            tokenized_step = mo_sql_parsing.parse_bigquery(formatted_step)
+            tokenized_step = _parse_step(formatted_step)
             tokenized_steps.append(tokenized_step)
           except mo_parsing.ParseException as tokenizer_error2:
             # if parsing fails again, skip the step and log the error
@@ -185,6 +202,20 @@ class TokenizedQuery:
           _trace_formatter_error(step, tokenizer_error1, formatter_error)
     return tokenized_steps
 
+  @classmethod
+  def tokenize(cls, query: TQuery) -> List[JsonDict]:
+    """Removes comments from a raw query, splits it and tokenizes the steps.
+
+    Does not depend on the graph, so it can be run in a separate process.
+
+    Args:
+      query (Query): query to tokenize.
+    Returns:
+      List[JsonDict]: list of tokenized steps.
+    """
+    query_steps = cls._remove_comments_and_split_steps(query.raw_query)
+    return cls._tokenize_query(query_steps, query_name=str(query))
+
   def _process_other_step(self, step: JsonDict) -> None:
     """Processes step other than final step and adds it to the list.
 
@@ -220,15 +251,16 @@ class TokenizedQuery:
                                                temporary=False)
       self._tokenized_step_info_list.append(final_step_info)
 
-  def __init__(self, query: TQuery, graph: TGraph) -> None:
+  def __init__(self, query: TQuery, graph: TGraph,
+               tokenized_steps: Optional[List[JsonDict]] = None) -> None:
     self.raw_query = query.raw_query
     self.target_table = query.target_table
     self.domain = query.domain
     self.graph = graph
     self._tokenized_step_info_list = []
 
-    query_steps = self._remove_comments_and_split_steps(self.raw_query)
-    tokenized_steps = self._tokenize_query(query_steps)
+    if tokenized_steps is None:
+      tokenized_steps = self.tokenize(query)
     self._process_steps(tokenized_steps)
 
   def __repr__(self) -> str:
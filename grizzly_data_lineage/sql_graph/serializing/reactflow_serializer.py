@@ -49,11 +49,14 @@ class ReactFlowSerializer(Serializer):
     for obj in objects:
       if obj["parentNode"] is None:
         del obj["parentNode"]
-    connections = [{
-      "id": (conn.source.serializing_params.id + "-" +
-             conn.target.serializing_params.id),
-      "source": conn.source.serializing_params.id,
-      "target": conn.target.serializing_params.id,
-      "data": conn.data,
-    } for conn in self._get_connection_list()]
+    connections = []
+    for conn in self._get_connection_list():
+      source_id = conn.source.serializing_params.id
+      target_id = conn.target.serializing_params.id
+      connections.append({
+        "id": source_id + "-" + target_id,
+        "source": source_id,
+        "target": target_id,
+        "data": conn.data,
+      })
     return {"objects": objects, "connections": connections}
@@ -42,7 +42,7 @@ class Serializer(abc.ABC):
     graph.break_cycles()
     graph.calculate_table_serializing_params()
 
-    self._tables_for_serializing = graph.namespace.get_tables(recursive=True)
+    self._tables_for_serializing = graph.get_all_tables()
     self._tables_for_serializing.sort(key=lambda x: x.name)
     TopologicalLayout(self._tables_for_serializing)
 
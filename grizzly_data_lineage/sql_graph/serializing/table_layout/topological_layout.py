@@ -51,11 +51,17 @@ class TopologicalLayout:
     In the topological ordering, sources will always come before the references.
     This implementation of ordering, source will be places as close to its
     references as possible, thus reducing the crossing over of connections.
+    Tables can be reached many times, so their sources are collected once.
+    The graph does not change during layout.
     """
     queue = deque(self._tables_for_serializing)
+    sources_by_table: Dict[TTable, Tuple[TTable, ...]] = {}
     while queue:
       table = queue.popleft()
-      for source in table.get_all_sources():
+      sources = sources_by_table.get(table)
+      if sources is None:
+        sources = sources_by_table[table] = tuple(table.get_all_sources())
+      for source in sources:
         queue.append(source)
         self._table_order[source] = min(
           self._table_order[source],
@@ -0,0 +1,45 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for column level lineage parsing."""
+import contextlib
+import io
+import unittest
+
+from sql_graph import Graph
+from sql_graph.parsing import Query
+
+
+class ColumnLineageTest(unittest.TestCase):
+
+  def _get_column_sources(self, queries, table_name, column_name):
+    with contextlib.redirect_stdout(io.StringIO()):
+      graph = Graph(queries)
+    table = next(table for table in graph.get_all_tables()
+                 if table.name == table_name)
+    return [(source.table.name, source.name)
+            for source in table.columns[column_name].get_sources()]
+
+  def test_backticked_fully_qualified_column(self):
+    queries = [
+      Query("SELECT 1 AS a", "my-proj.ds.tbl", "d", "WRITE_TRUNCATE", None),
+      Query("SELECT `my-proj.ds.tbl`.a AS x FROM `my-proj.ds.tbl`",
+            "out", "d", "WRITE_TRUNCATE", None),
+    ]
+    self.assertEqual(self._get_column_sources(queries, "out", "x"),
+                     [("my-proj.ds.tbl", "a")])
+
+
+if __name__ == "__main__":
+  unittest.main()